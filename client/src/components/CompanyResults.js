@@ -146,7 +146,7 @@ const CompanyResults = ({ results, onSaveCompany, searchAreas }) => {
             </div>
             
             <div className="job-details">
-              <p className="job-description">{job.description || 'No description available'}</p>
+              <p className="job-description">{job.snippet || job.description || 'No description available'}</p>
               <div className="job-info">
                 <span className="salary">{formatSalary(job.salary_min, job.salary_max)}</span>
                 <span className="location">{getLocationText(job.location)}</span>
@@ -155,7 +155,7 @@ const CompanyResults = ({ results, onSaveCompany, searchAreas }) => {
             
             <div className="job-actions">
               <a
-                href={job.url}
+                href={job.redirect_url || job.url}
                 target="_blank"
                 rel="noopener noreferrer"
                 className="apply-button"
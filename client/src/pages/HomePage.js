@@ -66,63 +66,46 @@ const HomePage = () => {
       console.log('Formatted search areas:', formattedSearchAreas);
       setSearchAreas(formattedSearchAreas);
       
-      // Combine results from all locations
-      const allResults = [];
+      // Search every location in one batch: the server geocodes them together,
+      // shares provider queries between overlapping areas and dedups across them
+      const searchUrl = `${API_URL}/api/jobs/batch`;
+      console.log(`Searching for jobs at: ${searchUrl}`);
       
-      for (const location of searchParams.locations) {
-        console.log('Processing location for API call:', location);
-        const locationText = typeof location === 'string' ? location : location.display_name || 'Unknown Location';
-        console.log('Location text for API:', locationText);
-        
-        const params = new URLSearchParams({
-          location: locationText,
-          radius: searchParams.radius
-        });
-        
-        filters.categories.forEach(category => {
-          params.append('category', category);
-        });
-        
-        filters.jobTypes.forEach(jobType => {
-          params.append('job_type', jobType);
-        });
-        
-        const searchUrl = `${API_URL}/api/jobs?${params.toString()}`;
-        console.log(`Searching for jobs at: ${searchUrl}`);
-        
-        const response = await fetch(searchUrl);
-        
-        if (!response.ok) {
-          const errorText = await response.text();
-          console.error(`Error response: ${errorText}`);
-          throw new Error(`Server error: ${response.status} ${response.statusText}`);
-        }
-        
-        const data = await response.json();
-        console.log(`Found ${data.total} jobs for ${locationText}`);
-        console.log('First job data:', data.results?.[0]);
-        
-        if (data.error) {
-          throw new Error(data.error);
-        }
-        
-        // Add location information to each job
-        const jobsWithLocation = (data.results || []).map(job => {
-          const jobWithLocation = {
-            ...job,
-            searchLocation: locationText,
-            coordinates: job.coordinates || {
-              latitude: job.latitude,
-              longitude: job.longitude
-            }
-          };
-          console.log('Job with location:', jobWithLocation);
-          return jobWithLocation;
-        });
-        
-        allResults.push(...jobsWithLocation);
+      const response = await fetch(searchUrl, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          areas: formattedSearchAreas.map(location => [location, Number(searchParams.radius)]),
+          category: filters.categories,
+          job_type: filters.jobTypes
+        }),
+      });
+      
+      if (!response.ok) {
+        const errorText = await response.text();
+        console.error(`Error response: ${errorText}`);
+        throw new Error(`Server error: ${response.status} ${response.statusText}`);
       }
       
+      const data = await response.json();
+      console.log(`Found ${data.total} jobs across ${formattedSearchAreas.length} locations`);
+      
+      if (data.error) {
+        throw new Error(data.error);
+      }
+      
+      // Add location information to each job
+      const allResults = (data.results || []).map(job => ({
+        ...job,
+        searchLocation: job.search_location,
+        coordinates: job.coordinates || {
+          latitude: job.latitude,
+          longitude: job.longitude
+        }
+      }));
+      
       console.log('All results before setting state:', allResults);
       
       // Update the center to the first location's coordinates if available
@@ -6,11 +6,35 @@ from .reed_connector import ReedConnector
 from .google_jobs_connector import GoogleJobsConnector
 from .indeed_connector import IndeedConnector
 from .aggregator import JobAggregator
+from .geocoder import Geocoder
+from .enrichment import CompanyEnricher
+from .company_store import CompanyMetadataStore
+from .result_cache import SearchResultCache
+from .result_sets import ResultSetStore
+from .spatial_index import SpatialIndex
+from .dedup import DedupEngine
+from .job import Job
+from .base_connector import ProviderError
+from .governor import ProviderGovernor, CircuitOpenError
+from .query_planner import ConnectorCapabilities, plan_search
 
 __all__ = [
     'AdzunaConnector',
     'ReedConnector',
     'GoogleJobsConnector',
     'IndeedConnector',
-    'JobAggregator'
+    'JobAggregator',
+    'Geocoder',
+    'CompanyEnricher',
+    'CompanyMetadataStore',
+    'SearchResultCache',
+    'ResultSetStore',
+    'SpatialIndex',
+    'DedupEngine',
+    'Job',
+    'ProviderError',
+    'ProviderGovernor',
+    'CircuitOpenError',
+    'ConnectorCapabilities',
+    'plan_search'
 ] 
\ No newline at end of file
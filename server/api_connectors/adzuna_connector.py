@@ -1,7 +1,10 @@
 import os
-import aiohttp
 import json
-from .base_connector import BaseJobConnector
+import asyncio
+from .base_connector import BaseJobConnector, ProviderError
+from .fallback_policy import FallbackPolicy
+from .geo import haversine_km
+from .job import Job
 
 class AdzunaConnector(BaseJobConnector):
     """Connector for the Adzuna Jobs API"""
@@ -41,11 +44,20 @@ class AdzunaConnector(BaseJobConnector):
         "graduate"
     ]
     
+    # Results requested per page
+    PAGE_SIZE = 100
+    
     def __init__(self, app_id=None, api_key=None):
         super().__init__(api_key, app_id)
         self.app_id = app_id or os.getenv('ADZUNA_APP_ID')
         self.api_key = api_key or os.getenv('ADZUNA_API_KEY')
-        self.base_url = "https://api.adzuna.com/v1/api/jobs/gb/search/1"
+        # Page number is appended, e.g. .../search/1
+        self.base_url = "https://api.adzuna.com/v1/api/jobs/gb/search"
+        # When to run the generic zero-result fallback in parallel with the search
+        self.fallback = FallbackPolicy(
+            mode=os.getenv('ADZUNA_FALLBACK_MODE', FallbackPolicy.ADAPTIVE).lower(),
+            threshold=float(os.getenv('ADZUNA_FALLBACK_THRESHOLD', 0.5))
+        )
     
     def get_categories(self):
         """Get available job categories for Adzuna"""
@@ -55,8 +67,8 @@ class AdzunaConnector(BaseJobConnector):
         """Get available job types for Adzuna"""
         return self.JOB_TYPES
     
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
-        """Search for jobs on Adzuna"""
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        """Search for jobs on Adzuna, fetching further pages concurrently"""
         print(f"[Adzuna] Searching for jobs in {location} within {radius}km")
         
         # Use a larger search radius for Adzuna to ensure we get results
@@ -68,7 +80,7 @@ class AdzunaConnector(BaseJobConnector):
         params = {
             'app_id': self.app_id,
             'app_key': self.api_key,
-            'results_per_page': 100,
+            'results_per_page': self.PAGE_SIZE,
             'where': location,
             'distance': api_radius
         }
@@ -85,39 +97,110 @@ class AdzunaConnector(BaseJobConnector):
         
         print(f"[Adzuna] API params: {json.dumps(params)}")
         
+        # Broader query for when the area has no matches: drop location-specific params
+        generic_params = {key: value for key, value in params.items() if key not in ('where', 'distance')}
+        area = self.fallback.area_key(location, origin)
+        fallback = None
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    if response.status != 200:
-                        print(f"[Adzuna] API error: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    
-                    print(f"[Adzuna] Found {data.get('count', 0)} jobs")
-                    
-                    # If no results, try a more generic search
-                    if not data.get('results'):
-                        print("[Adzuna] No results, trying generic search")
-                        # Remove location-specific params
-                        generic_params = params.copy()
-                        if 'where' in generic_params:
-                            del generic_params['where']
-                        if 'distance' in generic_params:
-                            del generic_params['distance']
-                        
-                        async with session.get(self.base_url, params=generic_params) as generic_response:
-                            if generic_response.status != 200:
-                                return []
-                            
-                            data = await generic_response.json()
-                            print(f"[Adzuna] Generic search found {data.get('count', 0)} jobs")
-                    
-                    # Convert to standard format
-                    return [self.standardize_job(job) for job in data.get('results', [])]
+            # Where searches often come back empty, start the fallback alongside
+            if self.fallback.should_speculate(area):
+                print("[Adzuna] Starting generic search speculatively")
+                fallback = asyncio.ensure_future(self._get_json(self._page_url(1), params=generic_params))
+            
+            status, data = await self._get_json(self._page_url(1), params=params)
+            if status != 200:
+                print(f"[Adzuna] API error: {status}")
+                raise ProviderError(f"Adzuna API error: {status}")
+            
+            print(f"[Adzuna] Found {data.get('count', 0)} jobs")
+            self.fallback.record(area, empty=not data.get('results'))
+            
+            if data.get('results'):
+                self._drop(fallback)
+            else:
+                # No results, so use the more generic search
+                if fallback is None:
+                    print("[Adzuna] No results, trying generic search")
+                    status, data = await self._get_json(self._page_url(1), params=generic_params)
+                else:
+                    print("[Adzuna] No results, using speculative generic search")
+                    status, data = await fallback
+                    fallback = None
+                if status != 200:
+                    print(f"[Adzuna] API error on generic search: {status}")
+                    raise ProviderError(f"Adzuna API error: {status}")
+                
+                print(f"[Adzuna] Generic search found {data.get('count', 0)} jobs")
+                
+                # The generic search isn't location bound, so don't page through it
+                return [self.standardize_job(job) for job in data.get('results', [])]
+            
+            results = data['results']
+            results.extend(await self._paginate(
+                lambda page: self._fetch_page(page, params),
+                total=data.get('count', 0),
+                page_size=self.PAGE_SIZE,
+                first_page_count=len(results),
+                past_radius=self._past_radius_check(origin, radius)
+            ))
+            print(f"[Adzuna] Collected {len(results)} jobs")
+            
+            # Convert to standard format
+            return [self.standardize_job(job) for job in results]
         except Exception as e:
             print(f"[Adzuna] Error searching jobs: {str(e)}")
-            return []
+            raise
+        finally:
+            # E.g. the primary search failed or was cancelled
+            self._drop(fallback)
+    
+    @staticmethod
+    def _drop(fallback):
+        """Cancel a speculative search that turned out not to be needed"""
+        if fallback is None:
+            return
+        if not fallback.done():
+            fallback.cancel()
+        elif not fallback.cancelled():
+            # Retrieve any exception so it isn't reported as unhandled
+            fallback.exception()
+    
+    def _page_url(self, page):
+        """URL for a 1-based results page"""
+        return f"{self.base_url}/{page}"
+    
+    async def _fetch_page(self, page, params):
+        """Fetch one page of raw Adzuna results"""
+        status, data = await self._get_json(self._page_url(page), params=params)
+        if status != 200:
+            print(f"[Adzuna] API error on page {page}: {status}")
+            raise ProviderError(f"Adzuna API error on page {page}: {status}")
+        return data.get('results', [])
+    
+    def _past_radius_check(self, origin, radius):
+        """
+        Build a check for pages that show the results have left the radius
+        
+        Adzuna doesn't promise nearest-first results (``sort_by`` has no
+        distance order), so a page only counts when every job is located,
+        the page itself runs nearest first, and even its nearest job lies
+        outside the radius. A page in any other order never stops paging.
+        """
+        if not origin:
+            return None
+        
+        def past_radius(page_results):
+            if not page_results or not all(job.get('latitude') and job.get('longitude') for job in page_results):
+                return False
+            distances = [
+                haversine_km(origin['latitude'], origin['longitude'], job['latitude'], job['longitude'])
+                for job in page_results
+            ]
+            nearest_first = all(near <= far for near, far in zip(distances, distances[1:]))
+            return nearest_first and distances[0] > radius
+        
+        return past_radius
     
     def standardize_job(self, job_data):
         """Convert Adzuna job data to standard format"""
@@ -138,4 +221,5 @@ class AdzunaConnector(BaseJobConnector):
                 'maps_url': 'N/A'
             }
         
-        return job_data 
\ No newline at end of file
+        # Raw Adzuna fields we don't model are kept in the job's extras
+        return Job.from_dict(job_data)
\ No newline at end of file
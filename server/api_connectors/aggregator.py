@@ -1,18 +1,98 @@
 import asyncio
+import heapq
 from typing import List, Dict, Any, Optional
 import os
+import itertools
 import math
-import requests
+import time
+
+import aiohttp
+
+from .area_groups import group_areas
+from .dedup import DedupEngine
+from .geo import distances_km, nearest_within
+from .geocoder import Geocoder
+from .governor import CircuitOpenError
+from .job import Job
+from .query_planner import plan_search
+from .result_cache import SearchResultCache
+from .result_sets import ResultSetStore
+from .single_flight import SingleFlight
+from .spatial_index import SpatialIndex
+
+def _distance(job):
+    """Sort key putting the nearest jobs first."""
+    return job['distance']
+
+def _salary(job):
+    """Sort key for the best advertised salary, jobs without one last."""
+    salary = job.get('salary_max') or job.get('salary_min')
+    return float(salary) if salary else float('-inf')
+
+def _posted(job):
+    """Sort key for the posting date (ISO strings sort chronologically)."""
+    return job.get('created') or ''
+
+# Result orderings: name -> (key, descending)
+SORT_ORDERS = {
+    'distance': (_distance, False),
+    'salary': (_salary, True),
+    'date': (_posted, True)
+}
 
 class JobAggregator:
     """Aggregates job results from multiple API connectors."""
     
-    def __init__(self):
+    def __init__(self, geocoder=None, pool_size=None, pool_size_per_host=None, dns_cache_ttl=None,
+                 search_deadline=None, result_cache=None, result_sets=None):
         self.connectors = []
+        self.geocoder = geocoder or Geocoder()
+        self.result_cache = result_cache or SearchResultCache()
+        # Result sets that clients page, re-sort and re-filter by ID
+        self.result_sets = result_sets or ResultSetStore()
+        # Identical concurrent searches (and stale refreshes) share one live search
+        self._searches = SingleFlight('Aggregator')
         
-    def add_connector(self, connector):
-        """Add a job search connector to the aggregator."""
+        # Overall budget for one search; connectors still running are reported as timed out
+        self.search_deadline = search_deadline or float(os.getenv('SEARCH_DEADLINE', 12))
+        
+        # Keep-alive connection pool shared by every connector
+        self.pool_size = pool_size or int(os.getenv('HTTP_POOL_SIZE', 100))
+        self.pool_size_per_host = pool_size_per_host or int(os.getenv('HTTP_POOL_SIZE_PER_HOST', 20))
+        self.dns_cache_ttl = dns_cache_ttl or int(os.getenv('HTTP_DNS_CACHE_TTL', 300))
+        self.session = None
+        
+    def add_connector(self, connector, timeout=None):
+        """Add a job search connector to the aggregator, optionally overriding its timeout."""
+        if timeout is not None:
+            connector.timeout = timeout
         self.connectors.append(connector)
+        if self.session is not None:
+            connector.session = self.session
+    
+    async def startup(self):
+        """Open the shared connection pool and lend it to every connector."""
+        if self.session is not None and not self.session.closed:
+            return
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            ttl_dns_cache=self.dns_cache_ttl
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
+        for job_connector in self.connectors:
+            job_connector.session = self.session
+        print(f"[Aggregator] Opened shared HTTP pool (limit={self.pool_size}, per host={self.pool_size_per_host})")
+    
+    async def shutdown(self):
+        """Detach connectors and close the shared connection pool."""
+        for job_connector in self.connectors:
+            job_connector.session = None
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        print("[Aggregator] Closed shared HTTP pool")
     
     def get_categories(self):
         """Get combined list of categories from all connectors."""
@@ -28,81 +108,477 @@ class JobAggregator:
             all_job_types.update(connector.get_job_types())
         return sorted(list(all_job_types))
     
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
-        """Search for jobs across all connectors and return combined results."""
-        print(f"[Aggregator] Searching for jobs in {location} within {radius}km")
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None,
+                          sort='distance', offset=0, limit=None):
+        """
+        Search for jobs across all connectors and return combined results.
         
-        # Get coordinates for location using Google Maps API
-        GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
-        geocode_url = f"https://maps.googleapis.com/maps/api/geocode/json?address={location}&key={GOOGLE_MAPS_API_KEY}"
-        geocode_response = requests.get(geocode_url)
-        geocode_data = geocode_response.json()
+        Args:
+            location (str): Location string (city, address, etc.)
+            radius (float): Search radius in km
+            categories (list): List of job categories to filter by
+            job_types (list): List of job types to filter by
+            origin (dict): Already resolved search origin with ``latitude``,
+                ``longitude``, ``formatted_address`` and ``bounds``. When
+                omitted the location is geocoded here.
+            sort (str): Result order, one of SORT_ORDERS
+            offset (int): Number of jobs to skip
+            limit (int): Maximum number of jobs to return, all when None
+            
+        Returns:
+            dict: ``results`` with the requested page of deduplicated jobs
+            within the radius, ``total`` jobs in the whole result set, the
+            ``result_set`` ID to page it with later, ``sources`` with each connector's status (ok,
+            timeout, error, skipped while its circuit is open, or
+            unsupported when the query planner left it out), elapsed time and job count, ``cache``
+            saying whether the result was a cache hit, miss or stale, and
+            the ``origin`` and spatial ``index`` used by refilter.
+            Connectors that miss their timeout or the search deadline are
+            left out of the results rather than holding up the response.
+        """
+        cache_key = self.result_cache.make_key(location, radius, categories, job_types)
+        cached, state = self.result_cache.get(cache_key)
         
-        if geocode_data['status'] != 'OK':
-            raise ValueError('Could not geocode location')
+        def live_search():
+            return self._search_and_cache(cache_key, location, radius, categories, job_types, origin)
+        
+        if state == SearchResultCache.MISS:
+            # A fresh search of the same query over a wider radius already covers this one
+            covering = self.result_cache.find_covering(cache_key)
+            if covering is not None:
+                print(f"[Aggregator] Re-filtering a wider cached search for {location} within {radius}km")
+                return self._copy_result(self._narrowed(covering, radius), SearchResultCache.HIT,
+                                         sort=sort, offset=offset, limit=limit)
+            
+            result = await self._searches.do(cache_key, live_search)
+            return self._copy_result(result, state, sort=sort, offset=offset, limit=limit)
+        
+        if state == SearchResultCache.STALE:
+            # Serve the stale result now and refresh it in the background
+            print(f"[Aggregator] Serving stale results for {location}, refreshing in background")
+            refresh = asyncio.ensure_future(self._searches.do(cache_key, live_search))
+            refresh.add_done_callback(self._log_refresh_failure)
+        else:
+            print(f"[Aggregator] Cache {state} for {location} within {radius}km")
+        
+        return self._copy_result(cached, state, sort=sort, offset=offset, limit=limit)
+    
+    async def search_areas(self, areas, categories=None, job_types=None):
+        """
+        Search several areas at once, e.g. to compare towns.
+        
+        Areas are geocoded concurrently, overlapping areas share one provider
+        query (see group_areas), and the jobs of the whole batch are
+        deduplicated in a single pass.
+        
+        Args:
+            areas (list): (location, radius in km) pairs
+            categories (list): List of job categories to filter by
+            job_types (list): List of job types to filter by
+            
+        Returns:
+            dict: ``results`` with the deduplicated jobs of every area, each
+            tagged with the ``search_location`` it is nearest to and its
+            ``distance`` from it, nearest first; ``areas`` with each area's
+            geocoded origin and job count (or ``error``); and ``queries``
+            with the searches actually sent to the connectors
+        """
+        origins = await asyncio.gather(
+            *(self.resolve_origin(location) for location, _ in areas),
+            return_exceptions=True
+        )
+        
+        area_info = []
+        resolved = []
+        for (location, radius), origin in zip(areas, origins):
+            info = {'location': location, 'radius': radius}
+            if isinstance(origin, Exception):
+                info['error'] = str(origin)
+            else:
+                info['formatted_address'] = origin['formatted_address']
+                info['coordinates'] = {'latitude': origin['latitude'], 'longitude': origin['longitude']}
+                resolved.append((info, origin))
+            area_info.append(info)
+        
+        groups = group_areas([
+            {'latitude': origin['latitude'], 'longitude': origin['longitude'], 'radius': info['radius']}
+            for info, origin in resolved
+        ])
+        
+        def group_search(group):
+            anchor = resolved[group['anchor']][1]
+            # Round widened radii up so repeated batches share cache entries
+            radius = math.ceil(group['radius'] * 10) / 10
+            return self.search_jobs(
+                location=anchor['formatted_address'],
+                radius=radius,
+                categories=categories,
+                job_types=job_types,
+                origin=anchor,
+                limit=0  # Jobs are read from the result's index below
+            )
+        
+        group_results = await asyncio.gather(*(group_search(group) for group in groups), return_exceptions=True)
+        
+        # Each job once, with the nearest area that contains it
+        nearest = {}
+        queries = []
+        for group, result in zip(groups, group_results):
+            members = [resolved[i][0] for i in group['members']]
+            if isinstance(result, Exception):
+                for info in members:
+                    info['error'] = str(result)
+                continue
+            
+            queries.append({
+                'location': result['origin']['formatted_address'],
+                'radius': math.ceil(group['radius'] * 10) / 10,
+                'areas': [info['location'] for info in members],
+                'sources': result['sources'],
+                'cache': result['cache']
+            })
+            for info in members:
+                coordinates = info['coordinates']
+                matches = result['index'].within_radius(coordinates['latitude'], coordinates['longitude'], info['radius'])
+                info['total'] = len(matches)
+                for job, distance in matches:
+                    best = nearest.get(id(job))
+                    if best is None or distance < best[1]:
+                        nearest[id(job)] = (job, distance, info['location'])
+        
+        # One dedup pass over the batch; different queries list the same job under different ids
+        unique_jobs = DedupEngine(has_more_data=self._has_more_data)
+        for job, distance, location in sorted(nearest.values(), key=lambda match: match[1]):
+            job = job.copy()
+            job['distance'] = distance
+            job['search_location'] = location
+            record, existing = unique_jobs.add(job)
+            if existing is not None and existing['distance'] < record['distance']:
+                record['distance'] = existing['distance']
+                record['search_location'] = existing['search_location']
+        
+        print(f"[Aggregator] Batch of {len(areas)} areas used {len(queries)} searches, {len(unique_jobs)} unique jobs")
+        return {
+            'results': self.select_page(unique_jobs.records()),
+            'areas': area_info,
+            'queries': queries
+        }
+    
+    async def _search_and_cache(self, cache_key, location, radius, categories, job_types, origin):
+        """Run a live search and cache it unless a connector failed, timed out or was skipped."""
+        result = await self._search(location, radius, categories, job_types, origin)
+        if all(source['status'] not in ('error', 'timeout', 'skipped') for source in result['sources'].values()):
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    @staticmethod
+    def _log_refresh_failure(task):
+        """Log a background refresh that failed."""
+        if not task.cancelled() and task.exception() is not None:
+            print(f"[Aggregator] Background refresh failed: {str(task.exception())}")
+    
+    def refilter(self, result, radius=None, bounds=None, categories=None, job_types=None,
+                 cache_state=None, sort='distance', offset=0, limit=None):
+        """
+        Narrow, re-sort or page a search result (e.g. a stored result set)
+        using its spatial index, without querying the connectors again.
+        
+        Args:
+            result (dict): Result returned by search_jobs
+            radius (float): New radius in km around the result's origin
+            bounds (dict): Viewport with ``north``, ``south``, ``east``, ``west``
+            categories (list): Keep only jobs whose category label is listed
+            job_types (list): Keep only jobs whose contract type or time is listed
+            cache_state (str): Cache state to report, defaults to the result's
+            sort (str): Result order, one of SORT_ORDERS
+            offset (int): Number of matching jobs to skip
+            limit (int): Maximum number of jobs to return, all when None
+            
+        Returns:
+            dict: A copy of the result holding only the requested page of
+            matching jobs
+        """
+        index = result['index']
+        origin = result['origin']
+        
+        # Work from the indexed jobs; the result's own list may hold copies
+        if radius is not None:
+            jobs = [job for job, _ in index.within_radius(origin['latitude'], origin['longitude'], radius)]
+        else:
+            jobs = index.items
+        
+        if bounds is not None:
+            in_view = {id(job) for job in index.within_bounds(
+                bounds['south'], bounds['west'], bounds['north'], bounds['east']
+            )}
+            jobs = [job for job in jobs if id(job) in in_view]
+        
+        if categories:
+            wanted = set(categories)
+            jobs = [job for job in jobs if (job.get('category') or {}).get('label') in wanted]
+        
+        if job_types:
+            wanted = set(job_types)
+            jobs = [job for job in jobs if job.get('contract_type') in wanted or job.get('contract_time') in wanted]
+        
+        return self._copy_result(result, cache_state or result.get('cache'), jobs, sort, offset, limit)
+    
+    def _narrowed(self, result, radius):
+        """
+        A result set holding only a wider result's jobs within ``radius``.
+        
+        It gets its own radius and spatial index, so paging or re-filtering
+        it later never reaches the wider result's jobs. Narrowed sets are
+        kept on the wider result, so they expire with it.
+        """
+        narrowed = result.setdefault('narrowed', {})
+        if radius not in narrowed:
+            origin = result['origin']
+            jobs = [job for job, _ in result['index'].within_radius(origin['latitude'], origin['longitude'], radius)]
+            narrowed[radius] = {
+                'results': jobs,
+                'sources': result['sources'],
+                'origin': origin,
+                'radius': radius,
+                'index': SpatialIndex(jobs)
+            }
+        return narrowed[radius]
+    
+    @staticmethod
+    def select_page(jobs, offset=0, limit=None, sort='distance'):
+        """
+        One page of jobs in the requested order (nearest first by default).
         
-        # Extract coordinates
-        coordinates = geocode_data['results'][0]['geometry']['location']
-        lat = coordinates['lat']
-        lng = coordinates['lng']
+        With a limit only the first ``offset + limit`` jobs are selected
+        (a heap-based partial sort), so the rest of a large result set is
+        never fully sorted. Ties keep their original order either way.
+        
+        Raises:
+            ValueError: If the sort order is unknown
+        """
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {sort}")
+        key, descending = SORT_ORDERS[sort]
+        
+        if limit is None:
+            ranked = sorted(jobs, key=key, reverse=descending)
+        elif descending:
+            ranked = heapq.nlargest(offset + limit, jobs, key=key)
+        else:
+            ranked = heapq.nsmallest(offset + limit, jobs, key=key)
+        return ranked[offset:]
+    
+    def _copy_result(self, result, cache_state, jobs=None, sort='distance', offset=0, limit=None):
+        """
+        Copy a page of a (possibly cached) result so callers can annotate jobs safely.
+        
+        A copy points back to the full result it was taken from, so copying
+        or re-filtering a copy again still registers the full result.
+        """
+        source = result.get('source', result)
+        jobs = source['results'] if jobs is None else jobs
+        page = self.select_page(jobs, offset, limit, sort)
+        return {
+            'results': [job.copy() for job in page],
+            'total': len(jobs),
+            'offset': offset,
+            # (Re-)registered on every read so a cached result can always be paged
+            'result_set': self.result_sets.put(source),
+            'source': source,
+            'sources': result['sources'],
+            'origin': result['origin'],
+            'radius': result.get('radius'),
+            'index': result['index'],
+            'cache': cache_state
+        }
+    
+    async def _search(self, location, radius, categories, job_types, origin):
+        """Run a live search across all connectors, bypassing the cache."""
+        unique_jobs = {}
+        summary = {}
+        async for event in self.stream_jobs(location, radius, categories, job_types, origin):
+            if event['event'] == 'jobs':
+                for job in event['results']:
+                    unique_jobs[job['id']] = job
+            elif event['event'] == 'summary':
+                summary = event
+        
+        # Left unsorted; each page is selected nearest first when it's served
+        processed_results = list(unique_jobs.values())
+        
+        print(f"[Aggregator] Found {len(processed_results)} jobs after processing")
+        return {
+            'results': processed_results,
+            'sources': summary['sources'],
+            'origin': summary['origin'],
+            'radius': radius,
+            # Built once per result set so re-filtering doesn't rescan every job
+            'index': SpatialIndex(processed_results)
+        }
+    
+    async def stream_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        """
+        Search all connectors and yield results as each connector completes.
+        
+        Takes the same arguments as search_jobs. Yields event dicts:
+        
+        - ``{'event': 'jobs', 'source': name, 'status': {...}, 'results': [...]}``
+          with the connector's new distance-filtered jobs, plus earlier jobs
+          that this batch's duplicates were merged into (upsert by id)
+        - ``{'event': 'dedup', 'merged': [ids]}`` listing the already yielded
+          jobs that were just updated with a duplicate's fields
+        - ``{'event': 'summary', 'total': n, 'sources': {...}, 'origin': {...}}``
+          once every connector is done or the search deadline has passed
+        """
+        print(f"[Aggregator] Searching for jobs in {location} within {radius}km")
+        
+        if origin is None:
+            origin = await self.resolve_origin(location)
+        
+        lat = origin['latitude']
+        lng = origin['longitude']
         
         # Get formatted address for the search area
-        formatted_address = geocode_data['results'][0].get('formatted_address', '')
+        formatted_address = origin.get('formatted_address') or location
         print(f"[Aggregator] Formatted address: {formatted_address}")
         
-        # Gather tasks for each connector
+        # Only query connectors that can contribute, each with the filters it understands
+        plans, skipped = plan_search(self.connectors, radius, categories, job_types)
+        sources = {}
+        for connector, reason in skipped:
+            name = self._connector_name(connector)
+            print(f"[Aggregator] Not searching {name}: {reason}")
+            sources[name] = {'status': 'unsupported', 'elapsed_ms': 0, 'count': 0, 'reason': reason}
+        
         tasks = []
-        for connector in self.connectors:
-            print(f"[Aggregator] Adding search task for {connector.__class__.__name__}")
-            # Handle both async and synchronous connectors
-            if hasattr(connector, 'search_jobs') and callable(connector.search_jobs):
-                try:
-                    task = connector.search_jobs(
-                        location=formatted_address,
-                        radius=radius,
-                        categories=categories,
-                        job_types=job_types
-                    )
-                    # If the connector returns a coroutine, add it as a task
-                    if asyncio.iscoroutine(task):
-                        tasks.append(task)
-                    else:
-                        # If it's a synchronous function, wrap it in a completed future
-                        future = asyncio.Future()
-                        future.set_result(task)
-                        tasks.append(future)
-                except Exception as e:
-                    print(f"[Aggregator] Error creating task for {connector.__class__.__name__}: {str(e)}")
-        
-        # Wait for all tasks to complete
-        results = []
-        if tasks:
+        for plan in plans:
+            connector = plan['connector']
+            print(f"[Aggregator] Adding search task for {connector.__class__.__name__} "
+                  f"(up to {plan['estimated_calls']} calls)")
+            tasks.append(asyncio.ensure_future(
+                self._run_connector(connector, formatted_address, plan['radius'], plan['categories'],
+                                    plan['job_types'], origin)
+            ))
+        
+        # Fuzzy title+company matching across every connector's jobs
+        unique_jobs = DedupEngine(has_more_data=self._has_more_data)
+        job_ids = itertools.count()
+        started = time.monotonic()
+        try:
             try:
-                connector_results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in connector_results:
-                    if isinstance(result, Exception):
-                        print(f"[Aggregator] Connector error: {str(result)}")
-                    elif isinstance(result, list):
-                        results.extend(result)
-            except Exception as e:
-                print(f"[Aggregator] Error gathering results: {str(e)}")
-        
-        # Deduplicate and normalize results
-        processed_results = self._process_results(results, lat, lng, radius)
+                for next_result in asyncio.as_completed(tasks, timeout=self.search_deadline):
+                    source, status, jobs = await next_result
+                    sources[source] = status
+                    added, merged = self._merge_results(jobs, unique_jobs, job_ids, lat, lng, radius)
+                    
+                    yield {'event': 'jobs', 'source': source, 'status': status, 'results': added}
+                    if merged:
+                        yield {'event': 'dedup', 'merged': merged}
+            except asyncio.TimeoutError:
+                elapsed_ms = round((time.monotonic() - started) * 1000)
+                for connector in self.connectors:
+                    name = self._connector_name(connector)
+                    if name not in sources:
+                        print(f"[Aggregator] {name} missed the {self.search_deadline}s search deadline")
+                        sources[name] = {'status': 'timeout', 'elapsed_ms': elapsed_ms, 'count': 0}
+            
+            yield {'event': 'summary', 'total': len(unique_jobs), 'sources': sources, 'origin': origin}
+        finally:
+            # The consumer may stop early; don't leave connector calls running
+            for task in tasks:
+                task.cancel()
+    
+    async def resolve_origin(self, location):
+        """
+        Geocode a location into a search origin without blocking the event
+        loop. Concurrent lookups for the same place share one request.
+        """
+        origin = await self.geocoder.geocode_async(location)
+        if origin is None:
+            raise ValueError('Could not geocode location')
+        return origin
+    
+    async def _run_connector(self, connector, location, radius, categories, job_types, origin):
+        """
+        Run one connector's search under its timeout.
         
-        print(f"[Aggregator] Found {len(processed_results)} jobs after processing")
-        return processed_results
+        Connectors whose circuit breaker is open are skipped straight away,
+        and a timeout counts as a failure towards opening it. A search cut
+        short by the breaker (e.g. calls refused while a half-open trial call
+        is in flight) is reported as skipped too, so it isn't cached.
+        
+        Returns:
+            tuple: (connector name, status dict, jobs)
+        """
+        name = self._connector_name(connector)
+        governor = getattr(connector, 'governor', None)
+        started = time.monotonic()
+        
+        def status(state, count=0, error=None):
+            result = {'status': state, 'elapsed_ms': round((time.monotonic() - started) * 1000), 'count': count}
+            if error:
+                result['error'] = error
+            if governor is not None and governor.state != governor.CLOSED:
+                result['circuit'] = governor.state
+            return result
+        
+        if governor is not None and not governor.is_available():
+            print(f"[Aggregator] Skipping {name}, its circuit breaker is open")
+            return name, status('skipped', error='Provider temporarily unavailable'), []
+        
+        try:
+            result = connector.search_jobs(
+                location=location,
+                radius=radius,
+                categories=categories,
+                job_types=job_types,
+                origin=origin
+            )
+            # Handle both async and synchronous connectors
+            if asyncio.iscoroutine(result):
+                result = await asyncio.wait_for(result, timeout=getattr(connector, 'timeout', None))
+            jobs = result if isinstance(result, list) else []
+            return name, status('ok', len(jobs)), jobs
+        except asyncio.TimeoutError:
+            print(f"[Aggregator] {name} timed out")
+            if governor is not None:
+                governor.record_failure()
+            return name, status('timeout'), []
+        except CircuitOpenError:
+            print(f"[Aggregator] Skipping {name}, its circuit breaker refused a call")
+            return name, status('skipped', error='Provider temporarily unavailable'), []
+        except Exception as e:
+            print(f"[Aggregator] Connector error from {name}: {str(e)}")
+            return name, status('error', error=str(e)), []
     
-    def _process_results(self, all_jobs, lat, lng, radius):
-        """Process all job results by deduplicating and enriching data."""
-        # Track jobs by title+company to avoid duplicates
-        unique_jobs = {}
-        processed_jobs = []
+    @staticmethod
+    def _connector_name(connector):
+        """Name used for a connector in logs and source status metadata."""
+        return getattr(connector, 'name', connector.__class__.__name__)
+    
+    def _merge_results(self, jobs, unique_jobs, job_ids, lat, lng, radius):
+        """
+        Merge one connector's jobs into the running deduplicated set.
+        
+        Args:
+            unique_jobs (DedupEngine): Jobs kept so far in this search
+            
+        Returns:
+            tuple: (new or updated jobs from this batch, ids of previously
+            yielded jobs that a duplicate in this batch was merged into)
+        """
+        added = {}
+        merged = []
         
         # Company blacklist
         COMPANY_BLACKLIST = []
         
-        for job in all_jobs:
+        candidates = []
+        for job in jobs:
+            # Connectors emit Job records; accept plain dicts from older ones
+            if not isinstance(job, Job):
+                job = Job.from_dict(job)
+            
             # Skip if company is in blacklist
             company_name = job.get('company', {}).get('display_name', '')
             if company_name in COMPANY_BLACKLIST:
@@ -112,61 +588,40 @@ class JobAggregator:
             # Add unique ID if not present
             if 'id' not in job:
                 title = job.get('title', '')
-                job['id'] = f"{title}_{company_name}_{len(processed_jobs)}"
-            
-            # Handle jobs without location data or distance calculation
-            job_lat = job.get('latitude')
-            job_lng = job.get('longitude')
+                job['id'] = f"{title}_{company_name}_{next(job_ids)}"
             
-            # If no coordinates or distance, add it with calculated distance
-            if not job_lat or not job_lng or 'distance' not in job:
-                job_lat = lat
-                job_lng = lng
-                job['latitude'] = job_lat
-                job['longitude'] = job_lng
+            # Jobs without location data are placed at the search origin
+            if not job.get('latitude') or not job.get('longitude'):
+                job['latitude'] = lat
+                job['longitude'] = lng
             
-            # Calculate distance if not provided
-            if 'distance' not in job:
-                distance = self._calculate_distance(lat, lng, job_lat, job_lng)
+            candidates.append(job)
+        
+        # Calculate distances in one batch for jobs that don't provide one
+        missing = [job for job in candidates if 'distance' not in job]
+        if missing:
+            distances = distances_km(
+                lat, lng,
+                [job['latitude'] for job in missing],
+                [job['longitude'] for job in missing]
+            )
+            for job, distance in zip(missing, distances):
                 job['distance'] = distance
-            
-            # Skip if outside radius
-            if job['distance'] > radius:
-                continue
-            
-            # Check for duplicates (same title and company)
-            job_key = f"{job.get('title', '')}__{company_name}"
-            
-            # If we haven't seen this job before, or this instance has more data, keep it
-            if job_key not in unique_jobs or self._has_more_data(job, unique_jobs[job_key]):
-                unique_jobs[job_key] = job
         
-        # Convert dict to list
-        processed_jobs = list(unique_jobs.values())
+        # Skip jobs outside the radius, visiting the rest nearest first
+        within_radius = nearest_within([job['distance'] for job in candidates], radius)
         
-        # Sort by distance
-        processed_jobs.sort(key=lambda x: x.get('distance', float('inf')))
+        for index in within_radius:
+            # Near-duplicates (same company, near-identical title) merge into the
+            # earlier record, keeping its id and the union of both records' fields
+            record, existing = unique_jobs.add(candidates[index])
+            if existing is not None and record['id'] not in added:
+                merged.append(record['id'])
+            added[record['id']] = record
         
-        return processed_jobs
+        return list(added.values()), merged
     
     def _has_more_data(self, new_job, existing_job):
         """Check if new job has more data than existing job."""
-        # Check if the new job has more fields with actual values
-        new_job_data_count = sum(1 for v in new_job.values() if v is not None and v != '')
-        existing_job_data_count = sum(1 for v in existing_job.values() if v is not None and v != '')
-        
-        return new_job_data_count > existing_job_data_count
-    
-    def _calculate_distance(self, lat1, lon1, lat2, lon2):
-        """Calculate distance between two points in kilometers using Haversine formula."""
-        # Convert decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        r = 6371  # Radius of earth in kilometers
-        
-        return c * r 
\ No newline at end of file
+        # Richness (fields with actual values) is cached on each Job
+        return new_job.richness > existing_job.richness
@@ -0,0 +1,41 @@
+from typing import Any, Dict, List, Sequence
+
+from .geo import haversine_km
+
+
+def group_areas(areas: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge overlapping search areas into shared provider queries.
+
+    Each group is one query around its anchor (the member with the largest
+    radius), widened to cover every member. An area only joins a group if
+    the widened circle is no bigger than the members' circles combined, so
+    merging never makes the providers search more ground than separate
+    queries would. Areas inside another area always merge.
+
+    Args:
+        areas: Dicts with ``latitude``, ``longitude`` and ``radius`` (km)
+
+    Returns:
+        list: Groups as ``{'anchor': index, 'radius': km, 'members': [indices]}``
+        with indices into ``areas``
+    """
+    groups = []
+    by_size = sorted(range(len(areas)), key=lambda i: areas[i]['radius'], reverse=True)
+    for i in by_size:
+        area = areas[i]
+        for group in groups:
+            anchor = areas[group['anchor']]
+            reach = haversine_km(anchor['latitude'], anchor['longitude'], area['latitude'], area['longitude'])
+            radius = max(group['radius'], reach + area['radius'])
+            if radius ** 2 <= group['_covered'] + area['radius'] ** 2:
+                group['radius'] = radius
+                group['_covered'] += area['radius'] ** 2
+                group['members'].append(i)
+                break
+        else:
+            groups.append({'anchor': i, 'radius': area['radius'], 'members': [i], '_covered': area['radius'] ** 2})
+
+    for group in groups:
+        del group['_covered']
+    return groups
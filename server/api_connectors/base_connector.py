@@ -1,15 +1,45 @@
+import os
+import math
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+from .governor import ProviderGovernor
+from .job import Job
+from .query_planner import ConnectorCapabilities
+
+class ProviderError(Exception):
+    """Raised when a job API answers with an error status."""
 
 class BaseJobConnector(ABC):
     """Base class for all job API connectors"""
     
+    # Declared to the query planner through capabilities()
+    PAGE_SIZE = 100  # results per API call
+    MAX_RADIUS = None  # km; wider searches are capped to it
+    CALL_COST = 1.0  # relative quota cost of one API call
+    SINGLE_VALUE_FILTERS = False  # one sub-query per category and job type
+    PAGINATES = True  # fetches further pages up to max_results
+    LIVE_RESULTS = True  # False for connectors returning placeholder data
+    
     def __init__(self, api_key=None, app_id=None):
         self.api_key = api_key
         self.app_id = app_id
         self.name = self.__class__.__name__
+        # Shared keep-alive session, attached by JobAggregator.startup()
+        self.session = None
+        # Seconds the aggregator waits for this connector before giving up
+        self.timeout = float(os.getenv('CONNECTOR_TIMEOUT', 8))
+        # Deep pagination: cap on results collected and pages fetched at once
+        self.max_results = int(os.getenv('CONNECTOR_MAX_RESULTS', 500))
+        self.page_concurrency = int(os.getenv('CONNECTOR_PAGE_CONCURRENCY', 3))
+        # Rate limit, adaptive concurrency and circuit breaker for this provider
+        self.governor = ProviderGovernor(self.name)
     
     @abstractmethod
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
         """
         Search for jobs based on location and filters
         
@@ -18,6 +48,8 @@ class BaseJobConnector(ABC):
             radius (float): Search radius in km
             categories (list): List of job categories to filter by
             job_types (list): List of job types to filter by
+            origin (dict): Resolved search origin (``latitude``/``longitude``),
+                when the caller has one
             
         Returns:
             list: List of standardized job objects
@@ -44,6 +76,168 @@ class BaseJobConnector(ABC):
         """
         pass
     
+    def capabilities(self):
+        """
+        Describe what this connector's searches can do, for the query planner
+        
+        Job types include the standard types the connector translates
+        (``JOB_TYPE_MAPPING`` values) as well as its own.
+        
+        Returns:
+            ConnectorCapabilities: Supported filters, limits and cost
+        """
+        job_types = set(self.get_job_types())
+        job_types.update(getattr(self, 'JOB_TYPE_MAPPING', {}).values())
+        return ConnectorCapabilities(
+            categories=self.get_categories(),
+            job_types=job_types,
+            max_radius=self.MAX_RADIUS,
+            page_size=self.PAGE_SIZE,
+            max_results=self.max_results if self.PAGINATES else None,
+            single_value_filters=self.SINGLE_VALUE_FILTERS,
+            call_cost=self.CALL_COST,
+            live=self.LIVE_RESULTS
+        )
+    
+    @asynccontextmanager
+    async def _session_scope(self):
+        """
+        Borrow the shared session, or open a temporary one when the
+        connector is used outside an aggregator
+        """
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+    
+    async def _get_json(self, url, params=None, headers=None):
+        """
+        GET a JSON endpoint through the shared connection pool
+        
+        Args:
+            url (str): Endpoint URL
+            params (dict): Query parameters; None values are dropped
+            headers (dict): Extra request headers
+            
+        Every call goes through the connector's governor, which may wait for
+        the provider's rate limit or concurrency limit.
+            
+        Returns:
+            tuple: (HTTP status, decoded JSON or None if the status isn't 200)
+            
+        Raises:
+            CircuitOpenError: If the provider is being skipped after repeated failures
+        """
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        
+        await self.governor.acquire()
+        status = None
+        failed = False
+        try:
+            async with self._session_scope() as session:
+                async with session.get(url, params=params, headers=headers) as response:
+                    status = response.status
+                    if status != 200:
+                        return status, None
+                    return status, await response.json(content_type=None)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            await self.governor.release(status, failed)
+    
+    async def _fan_out(self, queries, run_query, key):
+        """
+        Run single-value sub-queries concurrently and merge their raw results
+        
+        Used where a provider only takes one category or job type per call.
+        Calls stay within the provider's limits through the governor, and a
+        job returned by several sub-queries is kept once, as first seen.
+        
+        Args:
+            queries (list): Sub-query parameter dicts
+            run_query (callable): Coroutine function taking one sub-query and
+                returning its raw results
+            key (str): Field identifying a job in the raw results
+            
+        Returns:
+            list: Merged raw results, in sub-query order
+            
+        Raises:
+            Exception: The first sub-query's error if any sub-query failed, so
+                an incomplete search is reported rather than passed off as ok
+        """
+        outcomes = await asyncio.gather(*[run_query(query) for query in queries], return_exceptions=True)
+        
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        for query, outcome in zip(queries, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"[{self.name}] Error in sub-query {query}: {str(outcome)}")
+        if errors:
+            raise errors[0]
+        
+        merged = {}
+        for outcome in outcomes:
+            for item in outcome:
+                item_key = item.get(key)
+                merged.setdefault(id(item) if item_key is None else item_key, item)
+        
+        if len(queries) > 1:
+            print(f"[{self.name}] Merged {len(merged)} unique jobs from {len(queries)} sub-queries")
+        return list(merged.values())
+    
+    async def _paginate(self, fetch_page, total, page_size, first_page_count, past_radius=None, max_results=None):
+        """
+        Fetch the pages after the first one, up to ``max_results``
+        
+        Pages are requested in waves of ``page_concurrency``. Fetching stops
+        at the first empty page, or once ``past_radius`` reports a
+        page that lies entirely outside the search radius.
+        
+        Args:
+            fetch_page (callable): Coroutine function taking a 1-based page
+                number and returning that page's raw results
+            total (int): Total result count reported by the API
+            page_size (int): Results per page
+            first_page_count (int): Results already taken from page 1
+            past_radius (callable): Optional check on a page's raw results
+            max_results (int): Cap on results collected, defaulting to the
+                connector's ``max_results``
+            
+        Returns:
+            list: Raw results from page 2 onwards, in page order
+            
+        Raises:
+            Exception: The error of the first page that failed
+        """
+        wanted = min(total, max_results or self.max_results)
+        if first_page_count < page_size or first_page_count >= wanted:
+            return []
+        
+        last_page = math.ceil(wanted / page_size)
+        pages = list(range(2, last_page + 1))
+        results = []
+        
+        for start in range(0, len(pages), self.page_concurrency):
+            wave = pages[start:start + self.page_concurrency]
+            wave_results = await asyncio.gather(*[fetch_page(page) for page in wave], return_exceptions=True)
+            
+            for page, page_results in zip(wave, wave_results):
+                if isinstance(page_results, Exception):
+                    # Fail the search rather than pass off a truncated one as complete
+                    print(f"[{self.name}] Error fetching page {page}: {str(page_results)}")
+                    raise page_results
+                if not page_results:
+                    return results[:wanted - first_page_count]
+                results.extend(page_results)
+                if past_radius is not None and past_radius(page_results):
+                    print(f"[{self.name}] Page {page} is entirely outside the radius, stopping")
+                    return results[:wanted - first_page_count]
+        
+        return results[:wanted - first_page_count]
+    
     def standardize_job(self, job_data):
         """
         Convert API-specific job data to standard format
@@ -52,32 +246,32 @@ class BaseJobConnector(ABC):
             job_data (dict): API-specific job data
             
         Returns:
-            dict: Standardized job object
+            Job: Standardized job record
         """
         # This should be implemented by each connector
         # but providing a base implementation for safety
-        return {
-            "title": "Unknown",
-            "company": {
+        return Job(
+            title="Unknown",
+            company={
                 "display_name": "Unknown"
             },
-            "location": {
+            location={
                 "area": []
             },
-            "description": "No description available",
-            "redirect_url": "",
-            "source_api": self.name,
-            "latitude": None,
-            "longitude": None,
-            "category": {
+            description="No description available",
+            redirect_url="",
+            source_api=self.name,
+            latitude=None,
+            longitude=None,
+            category={
                 "label": "Unknown"
             },
-            "contract_type": "Unknown",
-            "created": None,
-            "company_metadata": {
+            contract_type="Unknown",
+            created=None,
+            company_metadata={
                 "address": "N/A",
                 "phone": "N/A",
                 "website": "N/A",
                 "maps_url": "N/A"
             }
-        } 
\ No newline at end of file
+        ) 
\ No newline at end of file
@@ -0,0 +1,36 @@
+from typing import Optional, Sequence
+
+
+class CategoryClassifier:
+    """Classifies jobs into a connector's categories by name matching.
+
+    A job gets the first category, in list order, whose name (without the
+    " Jobs" suffix) appears anywhere in its text, case-insensitively.
+    Lowercased names are prepared once per connector class and the job's
+    texts are joined and lowercased once, rather than once per category.
+    """
+
+    def __init__(self, categories: Sequence[str], suffix: str = ' Jobs'):
+        self._patterns = tuple(
+            (category, category.replace(suffix, '').lower())
+            for category in categories
+        )
+
+    def classify(self, *texts: Optional[str], default: str = 'Unknown') -> str:
+        """
+        Find the category for a job.
+
+        Args:
+            texts: The job's title, description and other text to match in;
+                empty values are skipped
+            default: Category returned when no name matches
+
+        Returns:
+            str: The first matching category, or ``default``
+        """
+        # Category names never contain a newline, so no match spans two texts
+        text = '\n'.join(filter(None, texts)).lower()
+        for category, pattern in self._patterns:
+            if pattern in text:
+                return category
+        return default
@@ -0,0 +1,110 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class CompanyMetadataStore:
+    """SQLite store for Google Places company details.
+
+    Rows are keyed by normalized company name plus locality. Found companies
+    stay fresh for ``ttl`` seconds; companies Places could not find are
+    remembered for ``negative_ttl`` seconds so we don't keep asking.
+    """
+
+    def __init__(self, path=None, ttl=None, negative_ttl=None):
+        self.path = path or os.getenv('COMPANY_STORE_PATH', 'company_metadata.sqlite3')
+        self.ttl = ttl if ttl is not None else int(os.getenv('COMPANY_STORE_TTL', 7 * 24 * 3600))
+        self.negative_ttl = negative_ttl if negative_ttl is not None else int(
+            os.getenv('COMPANY_STORE_NEGATIVE_TTL', 24 * 3600)
+        )
+
+        self._lock = threading.Lock()
+        self._db = self._open_db()
+
+    def get_many(self, company_keys: Iterable[str], locality: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch fresh entries for several companies in one query.
+
+        Args:
+            company_keys: Normalized company names
+            locality: Normalized search locality
+
+        Returns:
+            Dict of company key to place details, or to None for a cached
+            "not found". Companies with no fresh entry are left out.
+        """
+        company_keys = list(company_keys)
+        if self._db is None or not company_keys:
+            return {}
+
+        placeholders = ','.join('?' * len(company_keys))
+        with self._lock:
+            try:
+                rows = self._db.execute(
+                    f"SELECT company, details, stored_at FROM company_metadata "
+                    f"WHERE locality = ? AND company IN ({placeholders})",
+                    [locality] + company_keys
+                ).fetchall()
+            except sqlite3.Error as e:
+                print(f"[CompanyStore] Error reading store: {str(e)}")
+                return {}
+
+        now = time.time()
+        found = {}
+        for company, details, stored_at in rows:
+            if details is None:
+                if now - stored_at < self.negative_ttl:
+                    found[company] = None
+            elif now - stored_at < self.ttl:
+                found[company] = json.loads(details)
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, Optional[Dict[str, Any]]]], locality: str):
+        """Save lookup results, using None to record a company that wasn't found.
+
+        Args:
+            entries: (company key, place details or None) pairs
+            locality: Normalized search locality
+        """
+        if self._db is None:
+            return
+
+        stored_at = time.time()
+        rows = [
+            (company, locality, json.dumps(details) if details is not None else None, stored_at)
+            for company, details in entries
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO company_metadata (company, locality, details, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"[CompanyStore] Error writing store: {str(e)}")
+
+    def _open_db(self):
+        """Open the SQLite store, dropping rows past both freshness windows."""
+        try:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS company_metadata ("
+                "company TEXT NOT NULL, locality TEXT NOT NULL, details TEXT, stored_at REAL NOT NULL, "
+                "PRIMARY KEY (company, locality))"
+            )
+            db.execute(
+                "DELETE FROM company_metadata WHERE stored_at < ?",
+                (time.time() - max(self.ttl, self.negative_ttl),)
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            print(f"[CompanyStore] Store unavailable, enrichment will always hit Places: {str(e)}")
+            return None
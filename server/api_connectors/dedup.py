@@ -0,0 +1,179 @@
+import re
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from .job import Job
+from .normalization import normalize_company_name
+
+# Legal-form words that don't distinguish one employer from another
+_COMPANY_SUFFIXES = {
+    'ltd', 'limited', 'plc', 'llp', 'llc', 'inc', 'incorporated',
+    'corp', 'corporation', 'co', 'company', 'uk', 'gb', 'group'
+}
+
+# Common title abbreviations, expanded so "Sr Dev" matches "Senior Developer"
+_TITLE_ABBREVIATIONS = {
+    'sr': 'senior',
+    'snr': 'senior',
+    'jr': 'junior',
+    'jnr': 'junior',
+    'mgr': 'manager',
+    'dev': 'developer',
+    'eng': 'engineer',
+    'asst': 'assistant',
+    'admin': 'administrator'
+}
+
+# Gender markers such as "(m/f/d)" add nothing to a title
+_TITLE_NOISE = re.compile(r'\((?:m|f|d|w|x)(?:\s*/\s*(?:m|f|d|w|x))+\)', re.IGNORECASE)
+
+# Values that count as "no data" when merging duplicates
+_EMPTY_VALUES = (None, '', 'N/A', 'Unknown')
+
+
+def company_key(name: str) -> str:
+    """Normalized company name with legal suffixes dropped ("Acme Ltd" == "ACME Limited")."""
+    tokens = normalize_company_name(name).split()
+    if tokens and tokens[0] == 'the':
+        tokens = tokens[1:]
+    # "Smith & Co" leaves a dangling "and" once "co" is dropped
+    while len(tokens) > 1 and (tokens[-1] in _COMPANY_SUFFIXES or tokens[-1] == 'and'):
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def title_tokens(title: str) -> frozenset:
+    """Normalized word set of a job title."""
+    text = _TITLE_NOISE.sub(' ', title or '')
+    words = normalize_company_name(text).split()
+    return frozenset(_TITLE_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def is_empty(value: Any) -> bool:
+    """True for placeholder values that a duplicate may fill in."""
+    if isinstance(value, (dict, list)):
+        return not value
+    return value in _EMPTY_VALUES
+
+
+def merge_jobs(primary: Job, secondary: Job) -> Job:
+    """
+    Merge two records of the same job, keeping the union of their fields.
+
+    Fields from ``primary`` win; ``secondary`` fills in anything missing or
+    placeholder, one level deep for nested dicts such as company_metadata.
+
+    Returns:
+        Job: A new merged record
+    """
+    merged = primary.copy()
+    for key, value in secondary.items():
+        current = merged.get(key)
+        if is_empty(current):
+            if not is_empty(value):
+                merged[key] = value
+        elif isinstance(current, dict) and isinstance(value, dict):
+            nested = dict(current)
+            for nested_key, nested_value in value.items():
+                if is_empty(nested.get(nested_key)) and not is_empty(nested_value):
+                    nested[nested_key] = nested_value
+            merged[key] = nested
+    return merged
+
+
+class DedupEngine:
+    """Incremental near-duplicate detection across job sources.
+
+    Jobs are blocked by normalized company and then bucketed with MinHash
+    LSH over their normalized title words, so each new job is only compared
+    with the few records that share a bucket instead of with every record.
+    Candidates are confirmed with the exact Jaccard similarity of their
+    title words.
+    """
+
+    def __init__(self, threshold=0.8, num_hashes=16, bands=8, has_more_data=None):
+        """
+        Args:
+            threshold: Minimum title-word Jaccard similarity for a duplicate
+            num_hashes: MinHash signature length
+            bands: LSH bands the signature is split into
+            has_more_data: Callable(new, existing) deciding which record of a
+                duplicate pair becomes the primary when merging
+        """
+        self.threshold = threshold
+        self.rows = num_hashes // bands
+        self.bands = bands
+        self.has_more_data = has_more_data or (lambda new, existing: False)
+
+        seeds = random.Random(1729)
+        self._seeds = [seeds.getrandbits(32) for _ in range(num_hashes)]
+        self._records: List[Job] = []
+        self._tokens: List[frozenset] = []
+        self._buckets: Dict[Tuple, List[int]] = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def records(self) -> List[Job]:
+        """Current deduplicated records."""
+        return list(self._records)
+
+    def add(self, job: Job) -> Tuple[Job, Optional[Job]]:
+        """
+        Add a job, merging it into an existing record if it is a duplicate.
+
+        Returns:
+            tuple: (record now holding the job, record it was merged into or
+            None if the job is new). A merged record keeps the existing id.
+        """
+        company = company_key(job.get('company', {}).get('display_name', ''))
+        tokens = title_tokens(job.get('title', ''))
+        bucket_keys = self._bucket_keys(company, tokens)
+
+        slot = self._find_duplicate(bucket_keys, tokens)
+        if slot is None:
+            slot = len(self._records)
+            self._records.append(job)
+            self._tokens.append(tokens)
+            for key in bucket_keys:
+                self._buckets.setdefault(key, []).append(slot)
+            return job, None
+
+        existing = self._records[slot]
+        if self.has_more_data(job, existing):
+            merged = merge_jobs(job, existing)
+        else:
+            merged = merge_jobs(existing, job)
+        merged['id'] = existing['id']
+        self._records[slot] = merged
+        return merged, existing
+
+    def _bucket_keys(self, company, tokens):
+        """LSH bucket keys: one per band of the title's MinHash signature."""
+        signature = self._minhash(tokens)
+        return [
+            (company, band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _minhash(self, tokens):
+        if not tokens:
+            tokens = ('',)
+        return tuple(min(hash((seed, token)) for token in tokens) for seed in self._seeds)
+
+    def _find_duplicate(self, bucket_keys, tokens):
+        """Best-matching existing record among LSH candidates, if any clears the threshold."""
+        best_slot = None
+        best_similarity = self.threshold
+        seen = set()
+        for key in bucket_keys:
+            for slot in self._buckets.get(key, ()):
+                if slot in seen:
+                    continue
+                seen.add(slot)
+                other = self._tokens[slot]
+                union = len(tokens | other)
+                similarity = len(tokens & other) / union if union else 1.0
+                if similarity >= best_similarity:
+                    best_slot, best_similarity = slot, similarity
+        return best_slot
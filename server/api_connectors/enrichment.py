@@ -0,0 +1,210 @@
+import os
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .company_store import CompanyMetadataStore
+from .normalization import normalize_company_name, normalize_location
+from .single_flight import SingleFlight
+
+
+class CompanyEnricher:
+    """Fills in missing company metadata from Google Places.
+
+    Jobs are grouped by normalized company name so each distinct employer is
+    looked up once. Lookups run concurrently under a semaphore on a single
+    connection pool and the whole stage is bounded by ``time_budget``
+    seconds; anything still pending after that is returned un-enriched,
+    while its lookup finishes in the background. Results, including "not
+    found", are kept in a CompanyMetadataStore and checked before going to
+    the network.
+    """
+
+    FIND_PLACE_URL = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
+    DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+
+    def __init__(self, api_key=None, max_concurrency=None, time_budget=None, store=None):
+        self.api_key = api_key or os.getenv('GOOGLE_MAPS_API_KEY')
+        self.store = store or CompanyMetadataStore()
+        self._session = None
+        # Concurrent searches showing the same employer share one lookup
+        self._in_flight = SingleFlight('Enrichment')
+        self.max_concurrency = max_concurrency or int(os.getenv('PLACES_MAX_CONCURRENCY', 8))
+        self.time_budget = time_budget or float(os.getenv('PLACES_TIME_BUDGET', 5.0))
+
+    async def enrich(self, jobs: List[Dict[str, Any]], formatted_address: str) -> List[Dict[str, Any]]:
+        """Enrich jobs whose company metadata is missing, in place.
+
+        Args:
+            jobs: Standardized job dicts
+            formatted_address: Search area, added to each query for accuracy
+
+        Returns:
+            The same list of jobs
+        """
+        groups = {}
+        display_names = {}
+        for job in jobs:
+            if not self.needs_enrichment(job):
+                continue
+            company_name = job.get('company', {}).get('display_name', '')
+            key = normalize_company_name(company_name)
+            if not key:
+                continue
+            groups.setdefault(key, []).append(job)
+            display_names.setdefault(key, company_name)
+
+        if not groups:
+            return jobs
+
+        # Serve companies we already know about from the store
+        locality = normalize_location(formatted_address)
+        stored = self.store.get_many(groups.keys(), locality)
+        for key, details in stored.items():
+            if details:
+                for job in groups[key]:
+                    self._apply_details(job, details)
+            del groups[key]
+
+        if stored:
+            print(f"[Enrichment] {len(stored)} companies served from the metadata store")
+        if not groups:
+            return jobs
+
+        print(f"[Enrichment] Looking up {len(groups)} companies for {sum(len(g) for g in groups.values())} jobs")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        session = self._get_session()
+        tasks = {
+            asyncio.ensure_future(self._in_flight.do(
+                (key, locality),
+                lambda key=key: self._lookup_and_store(session, semaphore, key, display_names[key],
+                                                       formatted_address, locality)
+            )): key
+            for key in groups
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.time_budget)
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            # The shared lookups keep running and store their answers for next time
+            print(f"[Enrichment] Time budget exhausted, {len(pending)} lookups left un-enriched")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            definitive, details = task.result()
+            if details:
+                for job in groups[tasks[task]]:
+                    self._apply_details(job, details)
+        return jobs
+
+    async def enrich_areas(self, jobs_by_address: Dict[str, List[Dict[str, Any]]]):
+        """Enrich several search areas' jobs concurrently, in place.
+
+        Each area's companies are looked up with that area as context. The
+        areas run side by side, so together they take one ``time_budget``
+        rather than one each.
+
+        Args:
+            jobs_by_address: Each area's formatted address mapped to its jobs
+        """
+        await asyncio.gather(*[
+            self.enrich(jobs, formatted_address)
+            for formatted_address, jobs in jobs_by_address.items()
+        ])
+
+    async def close(self):
+        """Close the long-lived HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        """Return the keep-alive session, creating it on the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @staticmethod
+    def needs_enrichment(job: Dict[str, Any]) -> bool:
+        """True if the job has no company metadata worth showing."""
+        metadata = job.get('company_metadata')
+        return not metadata or all(value == 'N/A' for value in metadata.values())
+
+    async def _lookup(self, session, semaphore, company_name, formatted_address) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Find a company on Google Places.
+
+        Returns:
+            (definitive, details) where details is None if the company wasn't
+            found. Errors are not definitive, so they are never cached.
+        """
+        async with semaphore:
+            try:
+                print(f"[Enrichment] Getting additional metadata for company: {company_name}")
+                # Add location context to improve search accuracy
+                find_params = {
+                    'input': f"{company_name} {formatted_address}",
+                    'inputtype': 'textquery',
+                    'fields': 'place_id',
+                    'key': self.api_key
+                }
+                async with session.get(self.FIND_PLACE_URL, params=find_params) as response:
+                    places_data = await response.json()
+
+                if places_data.get('status') == 'ZERO_RESULTS':
+                    return True, None
+                if places_data.get('status') != 'OK' or not places_data.get('candidates'):
+                    return False, None
+
+                details_params = {
+                    'place_id': places_data['candidates'][0]['place_id'],
+                    'fields': 'name,formatted_address,formatted_phone_number,website,url',
+                    'key': self.api_key
+                }
+                async with session.get(self.DETAILS_URL, params=details_params) as response:
+                    details_data = await response.json()
+
+                if details_data.get('status') == 'NOT_FOUND':
+                    return True, None
+                if details_data.get('status') != 'OK':
+                    return False, None
+                return True, details_data.get('result')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Enrichment] Error getting company metadata for {company_name}: {str(e)}")
+                return False, None
+
+    async def _lookup_and_store(self, session, semaphore, company_key, company_name, formatted_address,
+                                locality) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look a company up and store a definitive answer, even one that came in past the time budget."""
+        definitive, details = await self._lookup(session, semaphore, company_name, formatted_address)
+        if definitive:
+            self.store.put_many([(company_key, details)], locality)
+        return definitive, details
+
+    def _apply_details(self, job, details):
+        """Copy Places details into the job's company_metadata."""
+        # Build a fresh dict so metadata shared between jobs is never mutated
+        metadata = {
+            'address': 'N/A',
+            'phone': 'N/A',
+            'website': 'N/A',
+            'maps_url': 'N/A'
+        }
+        metadata.update(job.get('company_metadata') or {})
+
+        # Update metadata with Google data (only if present)
+        if details.get('formatted_address'):
+            metadata['address'] = details['formatted_address']
+        if details.get('formatted_phone_number'):
+            metadata['phone'] = details['formatted_phone_number']
+        if details.get('website'):
+            metadata['website'] = details['website']
+        if details.get('url'):
+            metadata['maps_url'] = details['url']
+
+        job['company_metadata'] = metadata
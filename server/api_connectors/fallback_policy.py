@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class FallbackPolicy:
+    """Decides when a connector should start its broader fallback query early.
+
+    Some searches (sparse rural areas, niche filters) come back empty and
+    are retried with a broader query. Waiting for the empty answer first
+    doubles their latency, so the fallback can be launched speculatively
+    alongside the primary query and cancelled if the primary finds jobs.
+
+    Modes:
+
+    - ``sequential``: only query the fallback after an empty primary
+    - ``speculative``: always launch both at once
+    - ``adaptive``: launch both where the share of recent empty searches in
+      the area (a cell of about 11km) is at least ``threshold``. Unseen
+      areas use the rate across all searches.
+    """
+
+    SEQUENTIAL = 'sequential'
+    SPECULATIVE = 'speculative'
+    ADAPTIVE = 'adaptive'
+
+    # Weight of the newest outcome in the moving empty rates
+    AREA_WEIGHT = 0.3
+    OVERALL_WEIGHT = 0.1
+
+    def __init__(self, mode=ADAPTIVE, threshold=0.5, max_areas=1024):
+        if mode not in (self.SEQUENTIAL, self.SPECULATIVE, self.ADAPTIVE):
+            raise ValueError(f'Unknown fallback mode: {mode}')
+        self.mode = mode
+        self.threshold = threshold
+        self.max_areas = max_areas
+
+        self._area_rates = OrderedDict()
+        self._overall_rate = 0.0
+
+    @staticmethod
+    def area_key(location: str, origin: Optional[Dict[str, Any]] = None) -> Hashable:
+        """Area a search falls in: a 0.1 degree cell around the origin, else the location text."""
+        if origin and origin.get('latitude') is not None and origin.get('longitude') is not None:
+            return (round(origin['latitude'], 1), round(origin['longitude'], 1))
+        return location.strip().lower()
+
+    def empty_rate(self, area: Hashable) -> float:
+        """Moving share of recent searches in the area that found nothing."""
+        return self._area_rates.get(area, self._overall_rate)
+
+    def should_speculate(self, area: Hashable) -> bool:
+        """Whether to launch the fallback alongside the primary query."""
+        if self.mode == self.SPECULATIVE:
+            return True
+        if self.mode == self.ADAPTIVE:
+            return self.empty_rate(area) >= self.threshold
+        return False
+
+    def record(self, area: Hashable, empty: bool):
+        """Record whether the primary query for an area came back empty."""
+        outcome = 1.0 if empty else 0.0
+        self._overall_rate += self.OVERALL_WEIGHT * (outcome - self._overall_rate)
+
+        # An area's first outcome is taken as-is so sparse areas are learned at once
+        rate = self._area_rates.pop(area, None)
+        self._area_rates[area] = outcome if rate is None else rate + self.AREA_WEIGHT * (outcome - rate)
+        while len(self._area_rates) > self.max_areas:
+            self._area_rates.popitem(last=False)
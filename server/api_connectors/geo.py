@@ -0,0 +1,68 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the scalar haversine is used instead
+    np = None
+
+EARTH_RADIUS_KM = 6371  # Radius of earth in kilometers
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Calculate distance between two points in kilometers using Haversine formula."""
+    # Convert decimal degrees to radians
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    
+    # Haversine formula
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    c = 2 * math.asin(math.sqrt(a))
+    
+    return c * EARTH_RADIUS_KM
+
+
+def distances_km(lat, lng, lats, lngs):
+    """
+    Haversine distances in kilometers from one point to many, in one pass.
+    
+    Uses NumPy arrays when available and the scalar formula otherwise.
+    
+    Args:
+        lat (float): Origin latitude
+        lng (float): Origin longitude
+        lats (list): Target latitudes
+        lngs (list): Target longitudes
+        
+    Returns:
+        list: Distance to each target, as plain floats
+    """
+    if np is None:
+        return [haversine_km(lat, lng, target_lat, target_lng) for target_lat, target_lng in zip(lats, lngs)]
+    
+    lat1 = math.radians(lat)
+    lat2 = np.radians(np.asarray(lats, dtype=float))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(lngs, dtype=float)) - math.radians(lng)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return (2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))).tolist()
+
+
+def nearest_within(distances, radius):
+    """
+    Radius mask and distance sort computed from the same distances.
+    
+    Args:
+        distances (list): Distance of each item in kilometers
+        radius (float): Maximum distance to keep
+        
+    Returns:
+        list: Indices of items within the radius, nearest first (stable)
+    """
+    if np is None:
+        inside = [i for i, distance in enumerate(distances) if distance <= radius]
+        return sorted(inside, key=lambda i: distances[i])
+    
+    distances = np.asarray(distances, dtype=float)
+    inside = np.flatnonzero(distances <= radius)
+    return inside[np.argsort(distances[inside], kind='stable')].tolist()
@@ -0,0 +1,195 @@
+import os
+import json
+import asyncio
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+
+from .normalization import normalize_location
+from .single_flight import SingleFlight
+
+
+class Geocoder:
+    """Google Maps geocoder with an in-memory LRU and an on-disk SQLite cache.
+
+    Results are keyed on the normalized query, expire after ``ttl`` seconds
+    and survive restarts through the SQLite file at ``cache_path``. A
+    Google call taking longer than ``timeout`` seconds counts as a failed
+    geocode, so callers sharing an in-flight lookup are never held forever.
+    """
+
+    GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+    def __init__(self, api_key=None, cache_path=None, ttl=None, max_entries=None, timeout=None):
+        self.api_key = api_key or os.getenv('GOOGLE_MAPS_API_KEY')
+        self.cache_path = cache_path or os.getenv('GEOCODE_CACHE_PATH', 'geocode_cache.sqlite3')
+        self.ttl = ttl if ttl is not None else int(os.getenv('GEOCODE_CACHE_TTL', 30 * 24 * 3600))
+        self.max_entries = max_entries or int(os.getenv('GEOCODE_CACHE_SIZE', 1024))
+        self.timeout = timeout or float(os.getenv('GEOCODE_TIMEOUT', 5))
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = self._open_db()
+        self._in_flight = SingleFlight('Geocoder')
+
+    def geocode(self, location: str) -> Optional[Dict[str, Any]]:
+        """Resolve a location string to coordinates.
+
+        Args:
+            location: Free-text location (town, address or postcode)
+
+        Returns:
+            Dict with ``latitude``, ``longitude``, ``formatted_address`` and
+            ``bounds``, or None if Google could not geocode the location
+        """
+        key = normalize_location(location)
+        if not key:
+            return None
+
+        cached = self._get_cached(key)
+        if cached is not None:
+            print(f"[Geocoder] Cache hit for '{key}'")
+            return cached
+
+        print(f"[Geocoder] Cache miss for '{key}', calling Google Geocoding API")
+        try:
+            response = requests.get(
+                self.GEOCODE_URL,
+                params={'address': location, 'key': self.api_key},
+                timeout=self.timeout
+            )
+            geocode_data = response.json()
+        except requests.Timeout:
+            print(f"[Geocoder] Geocoding '{location}' timed out after {self.timeout}s")
+            return None
+        except Exception as e:
+            print(f"[Geocoder] Error geocoding '{location}': {str(e)}")
+            return None
+
+        print(f"[Geocoder] Geocode response status: {geocode_data.get('status')}")
+        if geocode_data.get('status') != 'OK' or not geocode_data.get('results'):
+            return None
+
+        result = self._parse_result(geocode_data['results'][0])
+        self._store(key, result)
+
+        # Callers often geocode the formatted address again, so cache it too
+        formatted_key = normalize_location(result['formatted_address'])
+        if formatted_key and formatted_key != key:
+            self._store(formatted_key, result)
+        return result
+
+    async def geocode_async(self, location: str) -> Optional[Dict[str, Any]]:
+        """Async variant of geocode that keeps the event loop free.
+
+        Cache hits are answered inline; misses run the blocking HTTP call
+        in the default executor, and concurrent misses for the same
+        normalized query share that one call.
+        """
+        key = normalize_location(location)
+        if not key:
+            return None
+
+        cached = self._get_cached(key)
+        if cached is not None:
+            print(f"[Geocoder] Cache hit for '{key}'")
+            return cached
+
+        loop = asyncio.get_running_loop()
+        return await self._in_flight.do(
+            key, lambda: loop.run_in_executor(None, self.geocode, location)
+        )
+
+    def _parse_result(self, result):
+        """Extract the fields we use from a Google geocoding result."""
+        geometry = result.get('geometry', {})
+        coordinates = geometry['location']
+        viewport = geometry.get('bounds') or geometry.get('viewport')
+
+        bounds = None
+        if viewport:
+            bounds = {
+                'north': viewport['northeast']['lat'],
+                'east': viewport['northeast']['lng'],
+                'south': viewport['southwest']['lat'],
+                'west': viewport['southwest']['lng']
+            }
+
+        return {
+            'latitude': coordinates['lat'],
+            'longitude': coordinates['lng'],
+            'formatted_address': result.get('formatted_address', ''),
+            'bounds': bounds
+        }
+
+    def _open_db(self):
+        """Open the SQLite cache, dropping entries that have already expired."""
+        try:
+            db = sqlite3.connect(self.cache_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geocode_cache ("
+                "query TEXT PRIMARY KEY, result TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM geocode_cache WHERE stored_at < ?", (time.time() - self.ttl,))
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            print(f"[Geocoder] Persistent cache unavailable, using memory only: {str(e)}")
+            return None
+
+    def _get_cached(self, key):
+        """Look up a key in memory first, then on disk."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                result, stored_at = entry
+                if now - stored_at < self.ttl:
+                    self._memory.move_to_end(key)
+                    return result
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+
+            try:
+                row = self._db.execute(
+                    "SELECT result, stored_at FROM geocode_cache WHERE query = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"[Geocoder] Error reading persistent cache: {str(e)}")
+                return None
+
+            if row is None or now - row[1] >= self.ttl:
+                return None
+
+            result = json.loads(row[0])
+            self._remember(key, result, row[1])
+            return result
+
+    def _store(self, key, result):
+        """Save a result in memory and on disk."""
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, result, stored_at)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO geocode_cache (query, result, stored_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(result), stored_at)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"[Geocoder] Error writing persistent cache: {str(e)}")
+
+    def _remember(self, key, result, stored_at):
+        """Insert into the in-memory LRU, evicting the least recently used entry."""
+        self._memory[key] = (result, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
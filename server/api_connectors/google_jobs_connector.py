@@ -3,6 +3,7 @@ import aiohttp
 import json
 from datetime import datetime
 from .base_connector import BaseJobConnector
+from .job import Job
 
 class GoogleJobsConnector(BaseJobConnector):
     """Connector for the Google Jobs API (Cloud Talent Solution)"""
@@ -47,6 +48,10 @@ class GoogleJobsConnector(BaseJobConnector):
         "OTHER": "other"
     }
     
+    # Searches return a placeholder job until the API request is implemented,
+    # so the query planner doesn't send searches here
+    LIVE_RESULTS = False
+    
     def __init__(self, client_id=None, client_secret=None, project_id=None):
         super().__init__()
         self.client_id = client_id or os.getenv('GOOGLE_CLIENT_ID')
@@ -65,7 +70,7 @@ class GoogleJobsConnector(BaseJobConnector):
         """Get available job types for Google Jobs"""
         return self.JOB_TYPES
     
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
         """Search for jobs on Google Jobs API"""
         print(f"[GoogleJobs] Searching for jobs in {location} within {radius}km")
         
@@ -84,32 +89,32 @@ class GoogleJobsConnector(BaseJobConnector):
     
     def _create_dummy_job(self, location):
         """Create a dummy job for demonstration purposes"""
-        return {
-            "id": f"google-jobs-{datetime.now().timestamp()}",
-            "title": "Software Engineer",
-            "company": {
+        return Job(
+            id=f"google-jobs-{datetime.now().timestamp()}",
+            title="Software Engineer",
+            company={
                 "display_name": "Google"
             },
-            "location": {
+            location={
                 "area": [location]
             },
-            "description": "This is a dummy job created by the Google Jobs connector for demonstration purposes.",
-            "redirect_url": "https://careers.google.com/",
-            "source_api": self.name,
-            "latitude": None,
-            "longitude": None,
-            "category": {
+            description="This is a dummy job created by the Google Jobs connector for demonstration purposes.",
+            redirect_url="https://careers.google.com/",
+            source_api=self.name,
+            latitude=None,
+            longitude=None,
+            category={
                 "label": "IT Jobs"
             },
-            "contract_type": "full_time",
-            "created": datetime.now().isoformat(),
-            "salary_min": 80000,
-            "salary_max": 150000,
-            "currency": "USD",
-            "company_metadata": {
+            contract_type="full_time",
+            created=datetime.now().isoformat(),
+            salary_min=80000,
+            salary_max=150000,
+            currency="USD",
+            company_metadata={
                 "address": f"Google Office, {location}",
                 "phone": "N/A",
                 "website": "https://google.com",
                 "maps_url": "N/A"
             }
-        }
\ No newline at end of file
+        )
\ No newline at end of file
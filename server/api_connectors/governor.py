@@ -0,0 +1,168 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class ProviderGovernor:
+    """Per-provider request governor shared by every search.
+
+    Combines three guards around each call to a job API:
+
+    - a token bucket holding calls to the provider's quota (``rate`` per
+      second with bursts of up to ``burst``)
+    - an adaptive concurrency limit that halves on HTTP 429 and creeps back
+      up by one per window of successful calls (AIMD)
+    - a circuit breaker that opens after ``failure_threshold`` consecutive
+      failures (429, 5xx, network errors, timeouts), so searches skip the
+      provider for ``recovery_time`` seconds, then lets a single trial call
+      through to decide whether it has recovered
+
+    Settings come from ``<PROVIDER>_RATE_LIMIT``-style environment
+    variables (e.g. ``REED_MAX_CONCURRENCY``), falling back to the
+    ``PROVIDER_*`` / ``CIRCUIT_*`` defaults.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, rate=None, burst=None, max_concurrency=None,
+                 failure_threshold=None, recovery_time=None):
+        self.name = name
+        prefix = name.upper().replace('CONNECTOR', '').strip().replace(' ', '_')
+
+        def setting(key, default_key, default):
+            return os.getenv(f'{prefix}_{key}', os.getenv(default_key, default))
+
+        self.rate = rate or float(setting('RATE_LIMIT', 'PROVIDER_RATE_LIMIT', 5))
+        self.burst = burst or float(setting('BURST', 'PROVIDER_BURST', 10))
+        self.max_concurrency = max_concurrency or int(setting('MAX_CONCURRENCY', 'PROVIDER_MAX_CONCURRENCY', 8))
+        self.failure_threshold = failure_threshold or int(setting('FAILURE_THRESHOLD', 'CIRCUIT_FAILURE_THRESHOLD', 5))
+        self.recovery_time = recovery_time or float(setting('RECOVERY_TIME', 'CIRCUIT_RECOVERY_TIME', 30))
+
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._slot_freed: Optional[asyncio.Condition] = None
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current adaptive limit on calls in flight."""
+        return max(1, int(self._limit))
+
+    def is_available(self) -> bool:
+        """False while the circuit is open and the provider should be skipped."""
+        if self.state == self.OPEN:
+            return time.monotonic() - self._opened_at >= self.recovery_time
+        if self.state == self.HALF_OPEN:
+            return not self._trial_in_flight
+        return True
+
+    async def acquire(self):
+        """
+        Wait for a token and a concurrency slot before calling the provider.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial call already in flight
+        """
+        self._check_circuit()
+
+        # Condition is created lazily so it binds to the running event loop
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Condition()
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < self.concurrency_limit)
+            self._in_flight += 1
+
+        try:
+            await self._take_token()
+        except BaseException:
+            await self._free_slot()
+            raise
+
+    async def release(self, status=None, failed=False):
+        """
+        Return the concurrency slot and record how the call went.
+
+        Args:
+            status (int): HTTP status of the response, if one came back
+            failed (bool): The call raised (network error, timeout, ...).
+                With neither a status nor a failure (e.g. the search was
+                cancelled) the call doesn't count either way.
+        """
+        await self._free_slot()
+        if status == 429:
+            # Throttled: halve the concurrency limit (multiplicative decrease)
+            self._limit = max(1.0, self._limit / 2)
+            print(f"[{self.name}] Rate limited, concurrency limit now {self.concurrency_limit}")
+            self.record_failure()
+        elif failed or (status is not None and status >= 500):
+            self.record_failure()
+        elif status is not None:
+            # Additive increase: about +1 per window of successful calls
+            self._limit = min(float(self.max_concurrency), self._limit + 1 / self.concurrency_limit)
+            self.record_success()
+        else:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            print(f"[{self.name}] Provider recovered, closing circuit")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call (also used by the aggregator for connector timeouts)."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                print(f"[{self.name}] {self._failures} consecutive failures, skipping provider for {self.recovery_time}s")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def snapshot(self):
+        """Current governor state for status reporting."""
+        return {
+            'circuit': self.state,
+            'concurrency_limit': self.concurrency_limit,
+            'in_flight': self._in_flight
+        }
+
+    def _check_circuit(self):
+        if self.state == self.CLOSED:
+            return
+        if not self.is_available():
+            raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+        # Recovery time is up (or the trial slot is free): let one trial call through
+        self.state = self.HALF_OPEN
+        self._trial_in_flight = True
+
+    async def _take_token(self):
+        """Token bucket: wait until the provider's quota allows another call."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def _free_slot(self):
+        async with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
@@ -1,8 +1,10 @@
 import os
-import aiohttp
 import json
 from datetime import datetime
-from .base_connector import BaseJobConnector
+from email.utils import parsedate_to_datetime
+from .base_connector import BaseJobConnector, ProviderError
+from .category_classifier import CategoryClassifier
+from .job import Job
 
 class IndeedConnector(BaseJobConnector):
     """Connector for the Indeed Jobs API"""
@@ -22,6 +24,9 @@ class IndeedConnector(BaseJobConnector):
         "Customer Service Jobs",
         "Legal Jobs"
     ]
+    
+    # Matches job text against JOB_CATEGORIES, prepared once for the class
+    CATEGORY_CLASSIFIER = CategoryClassifier(JOB_CATEGORIES)
 
     # Job types
     JOB_TYPES = [
@@ -43,6 +48,13 @@ class IndeedConnector(BaseJobConnector):
         "remote": "remote"
     }
     
+    # Max results per request (Indeed isn't paged here)
+    PAGE_SIZE = 25
+    PAGINATES = False
+    
+    # One keyword and one job type per call (see search_jobs)
+    SINGLE_VALUE_FILTERS = True
+    
     def __init__(self, publisher_id=None):
         super().__init__(publisher_id)
         self.publisher_id = publisher_id or os.getenv('INDEED_PUBLISHER_ID')
@@ -57,8 +69,13 @@ class IndeedConnector(BaseJobConnector):
         """Get available job types for Indeed"""
         return self.JOB_TYPES
     
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
-        """Search for jobs on Indeed API"""
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        """
+        Search for jobs on Indeed API
+        
+        Several categories or job types run as concurrent sub-queries whose
+        results are merged, dropping repeats by Indeed job key.
+        """
         print(f"[Indeed] Searching for jobs in {location} within {radius}km")
         
         if not self.publisher_id:
@@ -75,57 +92,55 @@ class IndeedConnector(BaseJobConnector):
             'publisher': self.publisher_id,
             'format': 'json',
             'v': '2',
-            'limit': 25,  # Max 25 results per request
+            'limit': self.PAGE_SIZE,
             'l': location,  # Location
             'radius': radius_miles,
             'sort': 'date',
             'fromage': 30  # Last 30 days
         }
         
-        # Add keyword filters for categories
-        if categories and len(categories) > 0:
-            # Use the first category as a keyword
-            category = categories[0].replace(" Jobs", "")
-            params['q'] = category
-        
-        # Add job type filter
-        if job_types and len(job_types) > 0:
-            # Map our job type to Indeed job type
-            for job_type in job_types:
-                # Find matching Indeed job type
-                for indeed_type, our_type in self.JOB_TYPE_MAPPING.items():
-                    if our_type == job_type:
-                        params['jt'] = indeed_type
-                        break
-        
-        print(f"[Indeed] API params: {json.dumps(params)}")
+        # Indeed takes one keyword and one job type per call, so expand the
+        # search into one sub-query per combination
+        keywords = list(dict.fromkeys(category.replace(" Jobs", "") for category in categories or [])) or [None]
+        indeed_types = list(dict.fromkeys(
+            indeed_type
+            for job_type in job_types or []
+            for indeed_type, our_type in self.JOB_TYPE_MAPPING.items()
+            if our_type == job_type or indeed_type == job_type
+        )) or [None]
+        queries = [dict(params, q=q, jt=jt) for q in keywords for jt in indeed_types]
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    if response.status != 200:
-                        print(f"[Indeed] API error: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    results = data.get('results', [])
-                    
-                    print(f"[Indeed] Found {len(results)} jobs")
-                    
-                    # Convert to standard format
-                    return [self.standardize_job(job) for job in results]
+            results = await self._fan_out(queries, self._search_query, key='jobkey')
+            
+            # Convert to standard format
+            return [self.standardize_job(job) for job in results]
         except Exception as e:
             print(f"[Indeed] Error searching jobs: {str(e)}")
-            return []
+            raise
+    
+    async def _search_query(self, params):
+        """Run one Indeed search, returning raw results"""
+        print(f"[Indeed] API params: {json.dumps(params)}")
+        
+        status, data = await self._get_json(self.base_url, params=params)
+        if status != 200:
+            print(f"[Indeed] API error: {status}")
+            raise ProviderError(f"Indeed API error: {status}")
+        
+        results = data.get('results', [])
+        
+        print(f"[Indeed] Found {len(results)} jobs")
+        return results
     
     def standardize_job(self, job_data):
         """Convert Indeed job data to standard format"""
-        # Parse date
+        # Parse date (RFC 822, e.g. "Mon, 02 Oct 2017 14:30:00 GMT") to ISO 8601
         date_posted = None
-        if 'date' in job_data:
+        if job_data.get('date'):
             try:
-                date_posted = job_data['date']
-            except:
+                date_posted = parsedate_to_datetime(job_data['date']).isoformat()
+            except (TypeError, ValueError):
                 pass
         
         # Extract salary if available
@@ -170,15 +185,7 @@ class IndeedConnector(BaseJobConnector):
                     currency = "USD"  # Default to USD
         
         # Determine category based on job title and description
-        category = "Unknown"
-        job_title = job_data.get('jobtitle', '')
-        job_snippet = job_data.get('snippet', '')
-        
-        for cat in self.JOB_CATEGORIES:
-            cat_name = cat.replace(' Jobs', '').lower()
-            if cat_name in job_title.lower() or cat_name in job_snippet.lower():
-                category = cat
-                break
+        category = self.CATEGORY_CLASSIFIER.classify(job_data.get('jobtitle'), job_data.get('snippet'))
         
         # Determine job type
         contract_type = "Unknown"
@@ -187,32 +194,32 @@ class IndeedConnector(BaseJobConnector):
             if indeed_job_type in self.JOB_TYPE_MAPPING:
                 contract_type = self.JOB_TYPE_MAPPING[indeed_job_type]
         
-        return {
-            "id": job_data.get('jobkey', f"indeed-{datetime.now().timestamp()}"),
-            "title": job_data.get('jobtitle', 'Unknown Position'),
-            "company": {
+        return Job(
+            id=job_data.get('jobkey', f"indeed-{datetime.now().timestamp()}"),
+            title=job_data.get('jobtitle', 'Unknown Position'),
+            company={
                 "display_name": job_data.get('company', 'Unknown')
             },
-            "location": {
+            location={
                 "area": [job_data.get('city', 'Unknown'), job_data.get('country', 'Unknown')]
             },
-            "description": job_data.get('snippet', 'No description available'),
-            "redirect_url": job_data.get('url', ''),
-            "source_api": self.name,
-            "latitude": job_data.get('latitude'),
-            "longitude": job_data.get('longitude'),
-            "category": {
+            description=job_data.get('snippet', 'No description available'),
+            redirect_url=job_data.get('url', ''),
+            source_api=self.name,
+            latitude=job_data.get('latitude'),
+            longitude=job_data.get('longitude'),
+            category={
                 "label": category
             },
-            "contract_type": contract_type,
-            "created": date_posted,
-            "salary_min": salary_min,
-            "salary_max": salary_max,
-            "currency": currency,
-            "company_metadata": {
+            contract_type=contract_type,
+            created=date_posted,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            currency=currency,
+            company_metadata={
                 "address": job_data.get('formattedLocation', 'N/A'),
                 "phone": 'N/A',
                 "website": 'N/A',
                 "maps_url": 'N/A'
             }
-        } 
\ No newline at end of file
+        ) 
\ No newline at end of file
@@ -0,0 +1,150 @@
+import html
+import re
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+_TAGS = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+
+# Compact shape served to the map and list views unless other fields are asked for
+LIST_FIELDS = (
+    'id', 'title', 'company', 'snippet', 'salary_min', 'salary_max',
+    'location', 'coordinates', 'contract_type', 'redirect_url'
+)
+
+# Length of the plain-text description preview
+SNIPPET_LENGTH = 200
+
+
+class Job:
+    """Compact standardized job record emitted by every connector.
+
+    Standard fields live in ``__slots__`` instead of a per-job dict, and any
+    provider-specific extras (e.g. raw Adzuna fields) go in ``extra``. Jobs
+    support the read/write dict operations the pipeline already uses
+    (``job['title']``, ``job.get(...)``, ``'distance' in job``) and are only
+    turned into plain dicts with ``to_dict`` at the response edge,
+    optionally projected to a few fields.
+
+    ``richness`` counts the fields holding a value and is cached until a
+    field changes, so duplicate resolution doesn't rescan both records on
+    every collision.
+    """
+
+    FIELDS = (
+        'id', 'title', 'company', 'location', 'description', 'redirect_url',
+        'source_api', 'latitude', 'longitude', 'distance', 'category',
+        'contract_type', 'contract_time', 'created', 'salary_min', 'salary_max',
+        'currency', 'company_metadata', 'coordinates'
+    )
+
+    _FIELD_NAMES = frozenset(FIELDS)
+
+    __slots__ = FIELDS + ('extra', '_richness')
+
+    def __init__(self, **fields):
+        self.extra: Optional[Dict[str, Any]] = None
+        self._richness: Optional[int] = None
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Job':
+        """Build a job from a standardized (or provider pass-through) dict."""
+        return cls(**data)
+
+    @property
+    def richness(self) -> int:
+        """Number of fields with an actual value (not None or empty string)."""
+        if self._richness is None:
+            self._richness = sum(1 for value in self.values() if value is not None and value != '')
+        return self._richness
+
+    @property
+    def snippet(self) -> str:
+        """Short plain-text preview of the description (Reed sends HTML)."""
+        text = html.unescape(_TAGS.sub(' ', self.get('description') or ''))
+        text = _WHITESPACE.sub(' ', text).strip()
+        if len(text) <= SNIPPET_LENGTH:
+            return text
+        return text[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '...'
+
+    def to_dict(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Plain dict for JSON serialization.
+
+        Args:
+            fields: Only include these fields (missing ones are skipped);
+                ``snippet`` is derived from the description. All fields
+                when None.
+        """
+        if fields is None:
+            return dict(self.items())
+
+        projected = {}
+        for key in fields:
+            if key == 'snippet':
+                projected[key] = self.snippet
+            elif key in self:
+                projected[key] = self[key]
+        return projected
+
+    def copy(self) -> 'Job':
+        """Shallow copy, so callers can annotate a cached job safely."""
+        job = Job.__new__(Job)
+        for key in Job.__slots__:
+            if hasattr(self, key):
+                setattr(job, key, getattr(self, key))
+        if self.extra is not None:
+            job.extra = dict(self.extra)
+        return job
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[tuple]:
+        for key in self.keys():
+            yield key, self[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_NAMES:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELD_NAMES:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        self._richness = None
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._FIELD_NAMES:
+            return hasattr(self, key)
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __repr__(self):
+        return f"Job(id={self.get('id')!r}, title={self.get('title')!r}, source_api={self.get('source_api')!r})"
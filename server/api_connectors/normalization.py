@@ -0,0 +1,40 @@
+import re
+
+# UK postcode written without its separating space, e.g. "sw1a1aa"
+_COMPACT_POSTCODE = re.compile(r'\b([a-z]{1,2}\d[a-z\d]?)(\d[a-z]{2})\b')
+_WHITESPACE = re.compile(r'\s+')
+_COMMA_SPACING = re.compile(r'\s*,\s*')
+_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9 ]+')
+
+
+def normalize_location(location: str) -> str:
+    """Normalize a free-text location so equivalent queries share a cache key.
+
+    Args:
+        location: Location as typed by the user (town, address or postcode)
+
+    Returns:
+        Lowercased location with collapsed whitespace, tidy commas and
+        UK postcodes in their canonical "outward inward" form
+    """
+    if not location:
+        return ''
+    text = _WHITESPACE.sub(' ', location.strip().lower())
+    text = _COMMA_SPACING.sub(', ', text).strip(', ')
+    return _COMPACT_POSTCODE.sub(r'\1 \2', text)
+
+
+def normalize_company_name(name: str) -> str:
+    """Normalize an employer name so the same company groups together.
+
+    Args:
+        name: Company display name as returned by a job API
+
+    Returns:
+        Lowercased name with punctuation removed and whitespace collapsed
+    """
+    if not name:
+        return ''
+    text = name.lower().replace('&', ' and ')
+    text = _NON_ALPHANUMERIC.sub(' ', text)
+    return _WHITESPACE.sub(' ', text).strip()
@@ -0,0 +1,103 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class ConnectorCapabilities:
+    """What a connector's search can do, as declared to the query planner.
+
+    ``categories`` and ``job_types`` are the filter values the connector
+    understands (None for any value). ``max_radius`` caps the search radius
+    its API accepts, in km. ``page_size``, ``max_results``,
+    ``single_value_filters`` (one sub-query per category and job type) and
+    ``call_cost`` (relative quota cost of one API call) estimate what a
+    search will cost. Connectors with ``live`` False only return
+    placeholder data and are never planned.
+    """
+
+    def __init__(self, categories: Optional[Iterable[str]] = None, job_types: Optional[Iterable[str]] = None,
+                 max_radius: Optional[float] = None, page_size: int = 100, max_results: Optional[int] = None,
+                 single_value_filters: bool = False, call_cost: float = 1.0, live: bool = True):
+        self.categories = frozenset(categories) if categories is not None else None
+        self.job_types = frozenset(job_types) if job_types is not None else None
+        self.max_radius = max_radius
+        self.page_size = page_size
+        self.max_results = max_results
+        self.single_value_filters = single_value_filters
+        self.call_cost = call_cost
+        self.live = live
+
+    def estimated_calls(self, categories=None, job_types=None) -> int:
+        """Upper bound on API calls for one search (paging may stop early)."""
+        queries = 1
+        if self.single_value_filters:
+            queries = max(1, len(categories or ())) * max(1, len(job_types or ()))
+        pages = math.ceil(self.max_results / self.page_size) if self.max_results else 1
+        return max(queries, pages)
+
+
+def _narrow(requested, supported):
+    """Requested filter values the connector understands, None when unfiltered."""
+    if not requested or supported is None:
+        return requested or None
+    return [value for value in requested if value in supported]
+
+
+def plan_search(connectors, radius: float, categories=None,
+                job_types=None) -> Tuple[List[Dict[str, Any]], List[Tuple[Any, str]]]:
+    """
+    Choose the connectors a search goes to, and the filters to send each.
+
+    A connector is skipped when it only returns placeholder data, or when
+    none of the requested categories (or job types) are ones it lists, so
+    no call is spent on a provider that can't contribute. The others get
+    only the filter values they understand and a radius within their limit.
+    Connectors that don't declare capabilities are always planned as-is.
+
+    Args:
+        connectors: Job connectors to choose from
+        radius: Search radius in km
+        categories: Requested job categories
+        job_types: Requested job types
+
+    Returns:
+        tuple: (plans, skipped). Plans are dicts with the ``connector`` and
+        the ``radius``, ``categories`` and ``job_types`` to search it with,
+        plus its ``estimated_calls`` and ``cost``, cheapest first. Skipped
+        is a list of (connector, reason).
+    """
+    plans = []
+    skipped = []
+    for connector in connectors:
+        capabilities = connector.capabilities() if hasattr(connector, 'capabilities') else None
+        if capabilities is None:
+            plans.append({'connector': connector, 'radius': radius, 'categories': categories,
+                          'job_types': job_types, 'estimated_calls': 1, 'cost': 0.0})
+            continue
+
+        if not capabilities.live:
+            skipped.append((connector, 'Returns placeholder data only'))
+            continue
+        connector_categories = _narrow(categories, capabilities.categories)
+        if categories and not connector_categories:
+            skipped.append((connector, 'No requested category is supported'))
+            continue
+        connector_job_types = _narrow(job_types, capabilities.job_types)
+        if job_types and not connector_job_types:
+            skipped.append((connector, 'No requested job type is supported'))
+            continue
+
+        connector_radius = radius
+        if capabilities.max_radius is not None:
+            connector_radius = min(radius, capabilities.max_radius)
+        calls = capabilities.estimated_calls(connector_categories, connector_job_types)
+        plans.append({
+            'connector': connector,
+            'radius': connector_radius,
+            'categories': connector_categories,
+            'job_types': connector_job_types,
+            'estimated_calls': calls,
+            'cost': calls * capabilities.call_cost
+        })
+
+    plans.sort(key=lambda plan: plan['cost'])
+    return plans, skipped
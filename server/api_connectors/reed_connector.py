@@ -1,9 +1,11 @@
 import os
-import aiohttp
 import json
+import math
 import base64
 from datetime import datetime
-from .base_connector import BaseJobConnector
+from .base_connector import BaseJobConnector, ProviderError
+from .category_classifier import CategoryClassifier
+from .job import Job
 
 class ReedConnector(BaseJobConnector):
     """Connector for the Reed.co.uk Jobs API"""
@@ -41,6 +43,9 @@ class ReedConnector(BaseJobConnector):
         "Social Care Jobs",
         "Transport & Logistics Jobs"
     ]
+    
+    # Matches job text against JOB_CATEGORIES, prepared once for the class
+    CATEGORY_CLASSIFIER = CategoryClassifier(JOB_CATEGORIES)
 
     # Job types
     JOB_TYPES = [
@@ -63,6 +68,21 @@ class ReedConnector(BaseJobConnector):
         "internship": "internship"
     }
     
+    # Search parameters selecting each Reed job type (one per call)
+    JOB_TYPE_PARAMS = {
+        "permanent": {"contractType": "permanent"},
+        "temp": {"contractType": "temp"},
+        "contract": {"contractType": "contract"},
+        "part_time": {"partTime": "true"},
+        "full_time": {"fullTime": "true"}
+    }
+    
+    # Reed's maximum resultsToTake
+    PAGE_SIZE = 100
+    
+    # One keyword and one job type per call (see search_jobs)
+    SINGLE_VALUE_FILTERS = True
+    
     def __init__(self, api_key=None):
         super().__init__(api_key)
         self.api_key = api_key or os.getenv('REED_API_KEY')
@@ -76,71 +96,123 @@ class ReedConnector(BaseJobConnector):
         """Get available job types for Reed"""
         return self.JOB_TYPES
     
-    async def search_jobs(self, location, radius, categories=None, job_types=None):
-        """Search for jobs on Reed.co.uk"""
+    def capabilities(self):
+        """Declare only the job types Reed has search parameters for"""
+        capabilities = super().capabilities()
+        capabilities.job_types = frozenset(
+            [reed_type for reed_type in self.JOB_TYPE_PARAMS] +
+            [our_type for reed_type, our_type in self.JOB_TYPE_MAPPING.items() if reed_type in self.JOB_TYPE_PARAMS]
+        )
+        return capabilities
+    
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        """
+        Search for jobs on Reed.co.uk, fetching further pages concurrently
+        
+        Reed takes one keyword and one job type per call, so a search for
+        several categories or job types runs one sub-query per combination
+        concurrently and merges them, dropping repeats by Reed job ID.
+        """
         print(f"[Reed] Searching for jobs in {location} within {radius}km")
         
         # Reed API parameters
         params = {
             'locationName': location,
             'distanceFromLocation': radius,
-            'resultsToTake': 100
+            'resultsToTake': self.PAGE_SIZE
         }
         
-        # Add category filters
-        if categories and len(categories) > 0:
-            # Reed allows only one category at a time, so we'll use the first one
-            first_category = categories[0]
-            # Remove "Jobs" suffix if present for better matching
-            if first_category.endswith(" Jobs"):
-                first_category = first_category[:-5]
-            params['keywords'] = first_category
-        
-        # Add job type filters
-        if job_types and len(job_types) > 0:
-            # Map our job types to Reed job types
-            reed_job_types = []
-            for job_type in job_types:
-                if job_type in self.JOB_TYPE_MAPPING.values():
-                    # Find the Reed job type that maps to our job type
-                    for reed_type, our_type in self.JOB_TYPE_MAPPING.items():
-                        if our_type == job_type and reed_type in self.JOB_TYPES:
-                            reed_job_types.append(reed_type)
-            
-            if reed_job_types:
-                # Reed API only supports one job type at a time
-                params['fullTime'] = 'true' if 'full_time' in reed_job_types else None
-                params['partTime'] = 'true' if 'part_time' in reed_job_types else None
-                params['contractType'] = 'permanent' if 'permanent' in reed_job_types else (
-                    'contract' if 'contract' in reed_job_types else None
-                )
-        
-        print(f"[Reed] API params: {json.dumps(params)}")
+        queries = [
+            dict(params, keywords=keywords, **type_params)
+            for keywords in self._category_keywords(categories)
+            for type_params in self._job_type_params(job_types)
+        ]
+        # Sub-queries share the connector's result cap (at least a page each)
+        max_results = max(self.PAGE_SIZE, math.ceil(self.max_results / len(queries)))
         
         # Reed API uses Basic Authentication with API key as username
         auth_header = f"Basic {base64.b64encode(f'{self.api_key}:'.encode()).decode()}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url, 
-                    params=params,
-                    headers={"Authorization": auth_header}
-                ) as response:
-                    if response.status != 200:
-                        print(f"[Reed] API error: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    results = data.get('results', [])
-                    
-                    print(f"[Reed] Found {len(results)} jobs")
-                    
-                    # Convert to standard format
-                    return [self.standardize_job(job) for job in results]
+            results = await self._fan_out(
+                queries,
+                lambda query: self._search_query(query, auth_header, max_results),
+                key='jobId'
+            )
+            
+            # Convert to standard format
+            return [self.standardize_job(job) for job in results]
         except Exception as e:
             print(f"[Reed] Error searching jobs: {str(e)}")
-            return []
+            raise
+    
+    def _category_keywords(self, categories):
+        """Keywords for each category, or [None] for no category filter"""
+        if not categories:
+            return [None]
+        keywords = []
+        for category in categories:
+            # Remove "Jobs" suffix if present for better matching
+            if category.endswith(" Jobs"):
+                category = category[:-5]
+            if category not in keywords:
+                keywords.append(category)
+        return keywords
+    
+    def _job_type_params(self, job_types):
+        """Reed parameters for each requested job type, or [{}] for no job type filter"""
+        type_params = []
+        for job_type in job_types or []:
+            # Reed's own job types, or the Reed job types that map to our job type
+            reed_types = [job_type] if job_type in self.JOB_TYPE_PARAMS else [
+                reed_type for reed_type, our_type in self.JOB_TYPE_MAPPING.items()
+                if our_type == job_type and reed_type in self.JOB_TYPE_PARAMS
+            ]
+            for reed_type in reed_types:
+                if self.JOB_TYPE_PARAMS[reed_type] not in type_params:
+                    type_params.append(self.JOB_TYPE_PARAMS[reed_type])
+        return type_params or [{}]
+    
+    async def _search_query(self, params, auth_header, max_results):
+        """Run one Reed search and page through it, returning raw results"""
+        print(f"[Reed] API params: {json.dumps(params)}")
+        
+        status, data = await self._get_json(
+            self.base_url,
+            params=params,
+            headers={"Authorization": auth_header}
+        )
+        if status != 200:
+            print(f"[Reed] API error: {status}")
+            raise ProviderError(f"Reed API error: {status}")
+        
+        results = data.get('results', [])
+        
+        print(f"[Reed] Found {data.get('totalResults', len(results))} jobs")
+        
+        # Reed already filters by distance server-side, so page until the cap
+        results.extend(await self._paginate(
+            lambda page: self._fetch_page(page, params, auth_header),
+            total=data.get('totalResults', len(results)),
+            page_size=self.PAGE_SIZE,
+            first_page_count=len(results),
+            max_results=max_results
+        ))
+        print(f"[Reed] Collected {len(results)} jobs")
+        return results
+    
+    async def _fetch_page(self, page, params, auth_header):
+        """Fetch one page of raw Reed results"""
+        page_params = dict(params, resultsToSkip=(page - 1) * self.PAGE_SIZE)
+        status, data = await self._get_json(
+            self.base_url,
+            params=page_params,
+            headers={"Authorization": auth_header}
+        )
+        if status != 200:
+            print(f"[Reed] API error on page {page}: {status}")
+            raise ProviderError(f"Reed API error on page {page}: {status}")
+        return data.get('results', [])
     
     def standardize_job(self, job_data):
         """Convert Reed job data to standard format"""
@@ -161,12 +233,7 @@ class ReedConnector(BaseJobConnector):
         category = "Unknown"
         if 'jobDescription' in job_data and job_data['jobDescription']:
             # Extract from job title or description
-            job_title = job_data.get('jobTitle', '')
-            for cat in self.JOB_CATEGORIES:
-                cat_name = cat.replace(' Jobs', '')
-                if cat_name.lower() in job_title.lower() or cat_name.lower() in job_data['jobDescription'].lower():
-                    category = cat
-                    break
+            category = self.CATEGORY_CLASSIFIER.classify(job_data.get('jobTitle'), job_data['jobDescription'])
         
         # Map contract type
         contract_type = "Unknown"
@@ -178,31 +245,36 @@ class ReedConnector(BaseJobConnector):
         # Build company display name
         company_name = job_data.get('employerName', 'Unknown')
         
-        return {
-            "title": job_data.get('jobTitle', 'Unknown Position'),
-            "company": {
+        job = Job(
+            title=job_data.get('jobTitle', 'Unknown Position'),
+            company={
                 "display_name": company_name
             },
-            "location": {
+            location={
                 "area": [job_data.get('locationName', 'Unknown'), job_data.get('townName', '')]
             },
-            "description": job_data.get('jobDescription', 'No description available'),
-            "redirect_url": job_data.get('jobUrl', ''),
-            "source_api": self.name,
-            "latitude": job_data.get('latitude'),
-            "longitude": job_data.get('longitude'),
-            "category": {
+            description=job_data.get('jobDescription', 'No description available'),
+            redirect_url=job_data.get('jobUrl', ''),
+            source_api=self.name,
+            latitude=job_data.get('latitude'),
+            longitude=job_data.get('longitude'),
+            category={
                 "label": category
             },
-            "contract_type": contract_type,
-            "created": date_posted,
-            "salary_min": job_data.get('minimumSalary'),
-            "salary_max": job_data.get('maximumSalary'),
-            "currency": "GBP",
-            "company_metadata": {
+            contract_type=contract_type,
+            created=date_posted,
+            salary_min=job_data.get('minimumSalary'),
+            salary_max=job_data.get('maximumSalary'),
+            currency="GBP",
+            company_metadata={
                 "address": f"{job_data.get('locationName', '')}, {job_data.get('townName', '')}",
                 "phone": "N/A",
                 "website": "N/A",
                 "maps_url": "N/A"
             }
-        } 
\ No newline at end of file
+        )
+        
+        # Stable ID from Reed's job ID, prefixed so it can't clash with other providers' IDs
+        if job_data.get('jobId') is not None:
+            job['id'] = f"reed-{job_data['jobId']}"
+        return job
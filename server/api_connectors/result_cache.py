@@ -0,0 +1,86 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from .normalization import normalize_location
+
+
+class SearchResultCache:
+    """Size-bounded LRU cache of aggregated search results.
+
+    Entries are fresh for ``ttl`` seconds and may then be served stale for a
+    further ``stale_ttl`` seconds while the caller refreshes them in the
+    background. Anything older is dropped.
+    """
+
+    HIT = 'hit'
+    STALE = 'stale'
+    MISS = 'miss'
+
+    def __init__(self, ttl=None, stale_ttl=None, max_entries=None):
+        self.ttl = ttl if ttl is not None else float(os.getenv('SEARCH_CACHE_TTL', 300))
+        self.stale_ttl = stale_ttl if stale_ttl is not None else float(os.getenv('SEARCH_CACHE_STALE_TTL', 1800))
+        self.max_entries = max_entries or int(os.getenv('SEARCH_CACHE_SIZE', 256))
+
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(location, radius, categories=None, job_types=None) -> Tuple[Hashable, ...]:
+        """Build a cache key from the normalized query."""
+        return (
+            normalize_location(location),
+            float(radius),
+            tuple(sorted(set(categories or []))),
+            tuple(sorted(set(job_types or [])))
+        )
+
+    def get(self, key) -> Tuple[Optional[Any], str]:
+        """
+        Look up a query.
+
+        Returns:
+            tuple: (cached value or None, one of HIT, STALE or MISS)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, self.MISS
+
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if age >= self.ttl + self.stale_ttl:
+            del self._entries[key]
+            return None, self.MISS
+
+        self._entries.move_to_end(key)
+        return value, self.HIT if age < self.ttl else self.STALE
+
+    def find_covering(self, key) -> Optional[Any]:
+        """
+        Find a fresh entry for the same query over an equal or wider radius.
+
+        Returns:
+            The cached value with the smallest covering radius, or None
+        """
+        location, radius, categories, job_types = key
+        now = time.monotonic()
+        best_key = None
+        for other_key, (value, stored_at) in self._entries.items():
+            other_location, other_radius, other_categories, other_job_types = other_key
+            if (other_location == location and other_categories == categories
+                    and other_job_types == job_types and other_radius >= radius
+                    and now - stored_at < self.ttl
+                    and (best_key is None or other_radius < best_key[1])):
+                best_key = other_key
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][0]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries beyond max_entries."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,120 @@
+import base64
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResultSetStore:
+    """Short-lived server-side store of search result sets.
+
+    Each stored search gets an opaque result-set ID that clients page
+    through (or re-sort and re-filter) without the connectors being queried
+    again. A set expires ``ttl`` seconds after it was last read, and the
+    least recently used sets are evicted beyond ``max_entries``. The store
+    is shared by request threads and the event loop, so access is locked.
+    """
+
+    def __init__(self, ttl=None, max_entries=None):
+        self.ttl = ttl if ttl is not None else float(os.getenv('RESULT_SET_TTL', 600))
+        self.max_entries = max_entries or int(os.getenv('RESULT_SET_SIZE', 128))
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, result: Dict[str, Any]) -> str:
+        """
+        Store a result set, reusing its ``result_set`` ID if it already has one.
+
+        Returns:
+            str: The result-set ID
+        """
+        with self._lock:
+            result_set_id = result.get('result_set') or secrets.token_urlsafe(12)
+            result['result_set'] = result_set_id
+            self._entries[result_set_id] = (result, time.monotonic())
+            self._entries.move_to_end(result_set_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return result_set_id
+
+    def get(self, result_set_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a result set, extending its lifetime; None once expired or evicted."""
+        with self._lock:
+            return self._get(result_set_id)
+
+    def _get(self, result_set_id: str) -> Optional[Dict[str, Any]]:
+        """get, for callers already holding the lock"""
+        entry = self._entries.get(result_set_id)
+        if entry is None:
+            return None
+
+        result, touched_at = entry
+        now = time.monotonic()
+        if now - touched_at >= self.ttl:
+            del self._entries[result_set_id]
+            return None
+
+        self._entries[result_set_id] = (result, now)
+        self._entries.move_to_end(result_set_id)
+        return result
+
+    def find_job(self, job_id: str, result_set_id: Optional[str] = None):
+        """
+        Look up one job's full record by ID.
+
+        Args:
+            job_id: The job's ``id``
+            result_set_id: Result set to look in; when omitted the most
+                recently used sets are searched
+
+        Returns:
+            tuple: (stored Job, the result set holding it), or (None, None)
+            if no live result set holds it
+        """
+        with self._lock:
+            if result_set_id is not None:
+                candidates = [result_set_id]
+            else:
+                candidates = list(reversed(self._entries))
+
+            now = time.monotonic()
+            for candidate in candidates:
+                entry = self._entries.get(candidate)
+                # Only the set that holds the job has its lifetime extended
+                if entry is None or now - entry[1] >= self.ttl:
+                    continue
+                result = entry[0]
+                if 'jobs_by_id' not in result:
+                    result['jobs_by_id'] = {job['id']: job for job in result['results']}
+                job = result['jobs_by_id'].get(job_id)
+                if job is not None:
+                    self._get(candidate)
+                    return job, result
+            return None, None
+
+
+def encode_cursor(view: Dict[str, Any]) -> str:
+    """Encode a result-set view (ID, filters, sort and offset) as an opaque cursor."""
+    data = json.dumps(view, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor made by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        view = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(view, dict) or 'result_set' not in view:
+        raise ValueError('Invalid cursor')
+    return view
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight task.
+
+    The first caller for a key starts the work; callers that arrive while it
+    is running wait on the same task and share its result (or exception).
+    The key is forgotten as soon as the task finishes.
+    """
+
+    def __init__(self, name='SingleFlight'):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``factory()`` for ``key`` unless an identical call is already running.
+
+        Args:
+            key: Hashable identity of the call
+            factory: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            The shared result of the in-flight call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            print(f"[{self.name}] Joining in-flight call for {key}")
+
+        # Shield so one caller being cancelled doesn't cancel it for everyone
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        """Drop a finished task, unless a newer one has replaced it."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every waiter has gone away
+        if not task.cancelled():
+            task.exception()
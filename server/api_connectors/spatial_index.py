@@ -0,0 +1,170 @@
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .geo import EARTH_RADIUS_KM, distances_km
+
+# Kilometres per degree of latitude on the sphere distances_km measures on
+KM_PER_DEGREE = math.radians(1) * EARTH_RADIUS_KM
+
+
+def job_coordinates(job: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Coordinates of a standardized job"""
+    return job.get('latitude'), job.get('longitude')
+
+
+class SpatialIndex:
+    """Grid index over lat/lon points for radius, nearest and bounding-box queries.
+
+    Points are bucketed into square cells of ``cell_size`` degrees, so a
+    query only looks at the cells it overlaps instead of scanning every
+    point. Build it once per result set and re-query it as the radius or
+    viewport changes. Items without coordinates are not indexed. Queries do
+    not wrap around the antimeridian.
+    """
+
+    def __init__(self, items: Sequence[Any], get_coordinates: Callable = job_coordinates, cell_size: float = 0.05):
+        """
+        Args:
+            items: Objects to index (e.g. jobs)
+            get_coordinates: Returns (lat, lon) for an item
+            cell_size: Grid cell size in degrees (0.05 is roughly 5km)
+        """
+        self.cell_size = cell_size
+        self.items = []
+        self.lats = []
+        self.lngs = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for item in items:
+            lat, lng = get_coordinates(item)
+            if lat is None or lng is None:
+                continue
+            index = len(self.items)
+            self.items.append(item)
+            self.lats.append(float(lat))
+            self.lngs.append(float(lng))
+            self._cells.setdefault(self._cell(lat, lng), []).append(index)
+
+        if self._cells:
+            rows = [row for row, _ in self._cells]
+            cols = [col for _, col in self._cells]
+            self._extent = (min(rows), max(rows), min(cols), max(cols))
+
+    def __len__(self):
+        return len(self.items)
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> List[Tuple[Any, float]]:
+        """
+        Items within ``radius_km`` of a point.
+
+        Returns:
+            list: (item, distance in km) pairs, nearest first
+        """
+        if not self.items:
+            return []
+
+        # Exact bounding box of the spherical cap, padded for float rounding
+        angle = radius_km / EARTH_RADIUS_KM
+        lat_span = math.degrees(angle) + 1e-9
+        cos_lat = math.cos(math.radians(lat))
+        if math.sin(angle) < cos_lat:
+            lng_span = math.degrees(math.asin(math.sin(angle) / cos_lat)) + 1e-9
+        else:
+            lng_span = 180  # The circle reaches a pole
+        candidates = self._indices_in_box(lat - lat_span, lng - lng_span, lat + lat_span, lng + lng_span)
+        return self._rank(lat, lng, candidates, radius_km)
+
+    def nearest(self, lat: float, lng: float, k: int) -> List[Tuple[Any, float]]:
+        """
+        The ``k`` items closest to a point.
+
+        Grid rings are searched outward from the point's cell until the
+        k-th best distance is closer than anything an unvisited ring could
+        hold.
+
+        Returns:
+            list: (item, distance in km) pairs, nearest first
+        """
+        if not self.items or k <= 0:
+            return []
+
+        row, col = self._cell(lat, lng)
+        min_row, max_row, min_col, max_col = self._extent
+        max_ring = max(abs(row - min_row), abs(row - max_row), abs(col - min_col), abs(col - max_col))
+
+        # Narrowest cell dimension near the point bounds how close an unvisited ring can be
+        cell_km = self.cell_size * KM_PER_DEGREE * max(math.cos(math.radians(min(abs(lat) + 1, 89))), 0.01)
+
+        candidates = []
+        for ring in range(max_ring + 1):
+            candidates.extend(self._ring_indices(row, col, ring))
+            if len(candidates) >= k:
+                ranked = self._rank(lat, lng, candidates)
+                if ranked[k - 1][1] <= ring * cell_km:
+                    return ranked[:k]
+
+        return self._rank(lat, lng, candidates)[:k]
+
+    def within_bounds(self, south: float, west: float, north: float, east: float) -> List[Any]:
+        """Items inside a bounding box (e.g. the map viewport), in index order."""
+        if not self.items:
+            return []
+        return [
+            self.items[i]
+            for i in sorted(self._indices_in_box(south, west, north, east))
+            if south <= self.lats[i] <= north and west <= self.lngs[i] <= east
+        ]
+
+    def _cell(self, lat, lng):
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def _indices_in_box(self, south, west, north, east):
+        """Indices of points in the cells a bounding box overlaps."""
+        min_row, max_row, min_col, max_col = self._extent
+        row_from, col_from = self._cell(south, west)
+        row_to, col_to = self._cell(north, east)
+        row_from, row_to = max(row_from, min_row), min(row_to, max_row)
+        col_from, col_to = max(col_from, min_col), min(col_to, max_col)
+
+        # A huge box over a sparse grid is cheaper to answer from the occupied cells
+        if (row_to - row_from + 1) * (col_to - col_from + 1) > len(self._cells):
+            return [
+                i for (row, col), indices in self._cells.items()
+                if row_from <= row <= row_to and col_from <= col <= col_to
+                for i in indices
+            ]
+
+        indices = []
+        for row in range(row_from, row_to + 1):
+            for col in range(col_from, col_to + 1):
+                indices.extend(self._cells.get((row, col), ()))
+        return indices
+
+    def _ring_indices(self, row, col, ring):
+        """Indices of points in the square ring of cells ``ring`` steps from (row, col)."""
+        if ring == 0:
+            return list(self._cells.get((row, col), ()))
+
+        indices = []
+        for r in range(row - ring, row + ring + 1):
+            if r in (row - ring, row + ring):
+                cols = range(col - ring, col + ring + 1)
+            else:
+                cols = (col - ring, col + ring)
+            for c in cols:
+                indices.extend(self._cells.get((r, c), ()))
+        return indices
+
+    def _rank(self, lat, lng, candidates, radius_km=math.inf):
+        """Exact distances for candidate indices, filtered to the radius, nearest first."""
+        if not candidates:
+            return []
+        distances = distances_km(
+            lat, lng,
+            [self.lats[i] for i in candidates],
+            [self.lngs[i] for i in candidates]
+        )
+        ranked = sorted(
+            (distance, i) for i, distance in zip(candidates, distances) if distance <= radius_km
+        )
+        return [(self.items[i], distance) for distance, i in ranked]
@@ -1,27 +1,38 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from werkzeug.datastructures import MultiDict
 from flask_cors import CORS
-import requests
 import os
 import math
-import json
-import asyncio
+import atexit
 from dotenv import load_dotenv
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
+from async_runtime import AsyncRuntime
+from http_utils import FastJSONProvider, compress_response, etag_json
+
 # Import API connectors
 from api_connectors import (
     AdzunaConnector, 
     ReedConnector, 
     GoogleJobsConnector,
     IndeedConnector,
-    JobAggregator
+    JobAggregator,
+    Geocoder,
+    CompanyEnricher,
+    SearchResultCache
 )
+from api_connectors.aggregator import SORT_ORDERS
+from api_connectors.geo import distances_km
+from api_connectors.job import LIST_FIELDS
+from api_connectors.result_sets import decode_cursor, encode_cursor
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)  # orjson when installed, stdlib json otherwise
+app.after_request(compress_response)  # gzip/Brotli negotiated from Accept-Encoding
 CORS(app)  # Enable CORS for all routes
 
 # API keys
@@ -39,8 +50,14 @@ GOOGLE_PROJECT_ID = os.getenv('GOOGLE_PROJECT_ID')
 # Blacklist of companies to filter out
 COMPANY_BLACKLIST = []
 
+# Shared geocoder so the API and the aggregator hit the same cache
+geocoder = Geocoder(GOOGLE_MAPS_API_KEY)
+
+# Google Places enrichment stage for jobs missing company details
+company_enricher = CompanyEnricher(GOOGLE_MAPS_API_KEY)
+
 # Initialize job aggregator with all connectors
-job_aggregator = JobAggregator()
+job_aggregator = JobAggregator(geocoder=geocoder)
 
 # Add connectors if API keys are available
 if ADZUNA_APP_ID and ADZUNA_API_KEY:
@@ -84,42 +101,232 @@ if GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET and GOOGLE_PROJECT_ID:
 else:
     print("Google OAuth credentials or project ID not found, skipping connector")
 
+# One long-lived event loop shared by every request
+runtime = AsyncRuntime()
+runtime.start()
+runtime.run(job_aggregator.startup())
+runtime.add_shutdown_hook(job_aggregator.shutdown)
+runtime.add_shutdown_hook(company_enricher.close)
+atexit.register(runtime.stop)
+
 # Get combined categories and job types
 ALL_CATEGORIES = job_aggregator.get_categories()
 ALL_JOB_TYPES = job_aggregator.get_job_types()
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two points in kilometers"""
-    # Convert decimal degrees to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+def filter_jobs(jobs, lat, lng, radius):
+    """Drop blacklisted companies and jobs outside the radius, adding frontend coordinates.
+
+    The jobs keep their incoming order, which is the page's requested sort.
+    """
+    candidates = []
+    for job in jobs:
+        # Skip if company is in blacklist
+        company_name = job.get('company', {}).get('display_name', '')
+        if company_name in COMPANY_BLACKLIST:
+            print(f"Company {company_name} is blacklisted, skipping")
+            continue
+        
+        # If no coordinates, place the job at the search origin
+        if not job.get('latitude') or not job.get('longitude'):
+            job['latitude'] = lat
+            job['longitude'] = lng
+            job['distance'] = 0
+        
+        candidates.append(job)
     
-    # Haversine formula
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    r = 6371  # Radius of earth in kilometers
+    # Calculate any missing distances in one batch (some APIs provide this)
+    missing = [job for job in candidates if 'distance' not in job]
+    if missing:
+        distances = distances_km(
+            lat, lng,
+            [job['latitude'] for job in missing],
+            [job['longitude'] for job in missing]
+        )
+        for job, distance in zip(missing, distances):
+            job['distance'] = distance
+    
+    # Skip if outside radius
+    filtered_jobs = []
+    for job in candidates:
+        if job['distance'] > radius:
+            continue
+        
+        # Add coordinates in the format expected by the frontend
+        job['coordinates'] = {
+            'latitude': job['latitude'],
+            'longitude': job['longitude']
+        }
+        
+        filtered_jobs.append(job)
     
-    return c * r
+    return filtered_jobs
+
+def parse_bounds(value):
+    """Parse a ``south,west,north,east`` viewport parameter"""
+    if not value:
+        return None
+    south, west, north, east = (float(part) for part in value.split(','))
+    return {'south': south, 'west': west, 'north': north, 'east': east}
+
+def parse_page(args):
+    """Parse ``offset`` and ``limit`` paging parameters (limit defaults to every job)"""
+    offset = int(args.get('offset', 0))
+    limit = args.get('limit')
+    limit = int(limit) if limit not in (None, '') else None
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError('offset and limit must not be negative')
+    return offset, limit
+
+def parse_fields(value):
+    """Parse a comma-separated ``fields`` projection (``all`` for full records)"""
+    if not value:
+        return list(LIST_FIELDS)
+    if value == 'all':
+        return None
+    return [field.strip() for field in value.split(',') if field.strip()]
+
+def parse_areas(value):
+    """Parse a batch's ``areas``: ``{"location", "radius"}`` objects or ``[location, radius]`` pairs"""
+    if not isinstance(value, list) or not value:
+        raise ValueError('areas must be a non-empty list')
+    max_areas = int(os.getenv('BATCH_MAX_AREAS', 10))
+    if len(value) > max_areas:
+        raise ValueError(f'At most {max_areas} areas can be searched at once')
+    
+    areas = []
+    for area in value:
+        if isinstance(area, dict):
+            location, radius = area.get('location'), area.get('radius', 10)
+        elif isinstance(area, list) and len(area) == 2:
+            location, radius = area
+        else:
+            raise ValueError('Each area must be {"location", "radius"} or [location, radius]')
+        if not location or not isinstance(location, str):
+            raise ValueError('Each area needs a location')
+        try:
+            radius = float(radius)
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid radius for {location}')
+        if not math.isfinite(radius) or radius < 0:
+            raise ValueError(f'Invalid radius for {location}')
+        areas.append((location, radius))
+    return areas
+
+def parse_list(value, name):
+    """Parse a JSON list of strings, taking a single string as a one-item list"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f'{name} must be a list of strings')
+    return value
+
+def wants_company_metadata(fields):
+    """Whether a projection includes the Places-enriched company details"""
+    return fields is None or 'company_metadata' in fields
+
+def parse_view(args):
+    """Parse the result-set, filter, sort and paging parameters of /api/jobs"""
+    try:
+        bounds = parse_bounds(args.get('bounds'))  # Optional map viewport
+    except ValueError:
+        raise ValueError('bounds must be south,west,north,east')
+    
+    try:
+        offset, limit = parse_page(args)  # Optional page of the result set
+    except ValueError:
+        raise ValueError('offset and limit must be non-negative integers')
+    
+    sort = args.get('sort', 'distance')
+    if sort not in SORT_ORDERS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_ORDERS)}")
+    
+    try:
+        radius = float(args['radius']) if args.get('radius') else None
+        if radius is not None and (not math.isfinite(radius) or radius < 0):
+            raise ValueError(radius)
+    except ValueError:
+        raise ValueError('radius must be a non-negative number')
+    
+    return {
+        'result_set': args.get('result_set'),
+        'radius': radius,
+        'categories': args.getlist('category'),  # Multiple categories can be selected
+        'job_types': args.getlist('job_type'),   # Multiple job types can be selected
+        'bounds': bounds,
+        'sort': sort,
+        'offset': offset,
+        'limit': limit,
+        'fields': parse_fields(args.get('fields'))
+    }
+
+def parse_cursor(cursor):
+    """Decode a ``cursor``, validating its view like the equivalent /api/jobs parameters"""
+    view = decode_cursor(cursor)
+    if not isinstance(view['result_set'], str):
+        raise ValueError('Invalid cursor')
+    try:
+        args = MultiDict({key: str(view[key]) for key in ('result_set', 'sort', 'offset')})
+        if view['radius'] is not None:
+            args['radius'] = str(view['radius'])
+        if view.get('limit') is not None:
+            args['limit'] = str(view['limit'])
+        bounds = view.get('bounds')
+        if bounds is not None:
+            args['bounds'] = ','.join(str(bounds[key]) for key in ('south', 'west', 'north', 'east'))
+        fields = view.get('fields')
+        args['fields'] = 'all' if fields is None else ','.join(fields)
+        args.setlist('category', [str(category) for category in view.get('categories') or []])
+        args.setlist('job_type', [str(job_type) for job_type in view.get('job_types') or []])
+    except (KeyError, TypeError):
+        raise ValueError('Invalid cursor')
+    return parse_view(args)
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """Get all available job categories"""
-    return jsonify(ALL_CATEGORIES)
+    return etag_json(ALL_CATEGORIES)
 
 @app.route('/api/job_types', methods=['GET'])
 def get_job_types():
     """Get all available job types"""
-    return jsonify(ALL_JOB_TYPES)
+    return etag_json(ALL_JOB_TYPES)
 
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    """Get jobs within radius of location using multiple APIs"""
-    # Get query parameters
-    location = request.args.get('location', '')
-    radius = float(request.args.get('radius', 10))  # default 10km
-    categories = request.args.getlist('category')  # Multiple categories can be selected
-    job_types = request.args.getlist('job_type')   # Multiple job types can be selected
+    """Get jobs within radius of location using multiple APIs
+    
+    Jobs come in a compact list shape (see LIST_FIELDS) unless ``fields``
+    names the fields to return, or is ``all`` for full records; the full
+    record of any job is also served by /api/jobs/<id>.
+    
+    Responses carry a ``result_set`` ID. Passing it back (with a different
+    ``offset``, ``sort``, narrower ``radius``, ``bounds``, ``category`` or
+    ``job_type``), or passing the ``next_cursor`` of a paged response as
+    ``cursor``, is answered from the stored results without querying the
+    APIs again.
+    """
+    try:
+        cursor = request.args.get('cursor')
+        view = parse_cursor(cursor) if cursor else parse_view(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        if view['result_set']:
+            return stored_jobs_response(view)
+        return search_jobs_response(request.args.get('location', ''), view)
+    except Exception as e:
+        print(f"Error processing request: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def search_jobs_response(location, view):
+    """Run a search (or serve it from the cache) and respond with the requested page"""
+    radius = view['radius'] or 10  # default 10km
+    categories = view['categories']
+    job_types = view['job_types']
+    bounds = view['bounds']
     
     print(f"Requested location: {location}")
     print(f"Requested radius: {radius}")
@@ -129,140 +336,245 @@ def get_jobs():
     if not location:
         return jsonify({'error': 'Location is required'}), 400
     
-    try:
-        # Get coordinates for location using Google Maps API
-        geocode_url = f"https://maps.googleapis.com/maps/api/geocode/json?address={location}&key={GOOGLE_MAPS_API_KEY}"
-        print(f"Geocoding URL: {geocode_url}")
-        geocode_response = requests.get(geocode_url)
-        geocode_data = geocode_response.json()
-        
-        print(f"Geocode response status: {geocode_data['status']}")
-        
-        if geocode_data['status'] != 'OK':
-            return jsonify({'error': 'Could not geocode location'}), 400
-        
-        # Extract coordinates
-        coordinates = geocode_data['results'][0]['geometry']['location']
-        lat = coordinates['lat']
-        lng = coordinates['lng']
-        
-        # Get formatted address for the search area
-        formatted_address = geocode_data['results'][0].get('formatted_address', '')
-        print(f"Formatted address: {formatted_address}")
-        
-        # Create the event loop and run the aggregator search
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        all_jobs = loop.run_until_complete(
-            job_aggregator.search_jobs(
-                location=formatted_address,
-                radius=radius,
-                categories=categories if categories else None,
-                job_types=job_types if job_types else None
-            )
+    # Get coordinates for location (cached, and shared with identical in-flight lookups)
+    geocoded = runtime.run(geocoder.geocode_async(location))
+    
+    if geocoded is None:
+        return jsonify({'error': 'Could not geocode location'}), 400
+    
+    # Run the aggregator search on the shared event loop. With a viewport
+    # the page is taken after narrowing, so skip copying any jobs here.
+    search_result = runtime.run(
+        job_aggregator.search_jobs(
+            location=geocoded['formatted_address'],
+            radius=radius,
+            categories=categories if categories else None,
+            job_types=job_types if job_types else None,
+            origin=geocoded,
+            sort=view['sort'],
+            offset=view['offset'] if bounds is None else 0,
+            limit=view['limit'] if bounds is None else 0
         )
-        loop.close()
+    )
+    
+    # Narrow to the map viewport using the result set's spatial index
+    if bounds is not None:
+        search_result = job_aggregator.refilter(
+            search_result, radius=radius, bounds=bounds, sort=view['sort'], offset=view['offset'], limit=view['limit']
+        )
+    
+    # The providers already applied the category and type filters to this result set
+    view = dict(view, radius=radius, categories=[], job_types=[])
+    return jobs_page_response(search_result, view)
+
+def stored_jobs_response(view):
+    """Page, re-sort or narrow a stored result set without querying the APIs"""
+    result = job_aggregator.result_sets.get(view['result_set'])
+    if result is None:
+        return jsonify({'error': 'Result set has expired, please search again'}), 410
+    
+    print(f"Re-filtering result set {view['result_set']}")
+    search_result = job_aggregator.refilter(
+        result,
+        radius=view['radius'],
+        bounds=view['bounds'],
+        categories=view['categories'],
+        job_types=view['job_types'],
+        cache_state=SearchResultCache.HIT,
+        sort=view['sort'],
+        offset=view['offset'],
+        limit=view['limit']
+    )
+    return jobs_page_response(search_result, dict(view, radius=view['radius'] or result['radius']))
+
+def jobs_page_response(search_result, view):
+    """Finish a page of jobs (blacklist, coordinates, enrichment) and build the response"""
+    origin = search_result['origin']
+    lat = origin['latitude']
+    lng = origin['longitude']
+    formatted_address = origin['formatted_address']
+    print(f"Formatted address: {formatted_address}")
+    
+    # Post-process to filter out blacklisted companies and apply distance filter
+    filtered_jobs = filter_jobs(search_result['results'], lat, lng, view['radius'])
+    
+    # Get additional metadata from Google Places, one lookup per company,
+    # unless the projection leaves it out anyway
+    fields = view.get('fields', list(LIST_FIELDS))
+    if wants_company_metadata(fields):
+        runtime.run(company_enricher.enrich(filtered_jobs, formatted_address))
+    
+    print(f"Returning {len(filtered_jobs)} of {search_result['total']} jobs")
+    
+    # Cursor for the next page of this same view of the result set
+    next_cursor = None
+    offset, limit = view['offset'], view['limit']
+    if limit and offset + limit < search_result['total']:
+        next_cursor = encode_cursor(dict(view, result_set=search_result['result_set'], offset=offset + limit))
+    
+    return jsonify({
+        'total': search_result['total'],
+        'offset': offset,
+        'results': [job.to_dict(fields) for job in filtered_jobs],
+        'result_set': search_result['result_set'],
+        'next_cursor': next_cursor,
+        'coordinates': {
+            'latitude': lat,
+            'longitude': lng
+        },
+        'sources': search_result['sources'],
+        'cache': search_result['cache']
+    })
+
+@app.route('/api/jobs/batch', methods=['POST'])
+def get_jobs_batch():
+    """Search several areas at once, e.g. ``{"areas": [["Leeds", 15], ["Sheffield", 15]]}``
+    
+    Also takes ``category``, ``job_type`` and ``fields`` lists (a single
+    string is taken as a one-item list). Areas are
+    geocoded concurrently, overlapping areas share provider queries and jobs
+    are deduplicated across the whole batch; each job carries the
+    ``search_location`` it is nearest to.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        areas = parse_areas(data.get('areas'))
+        fields = parse_fields(','.join(parse_list(data.get('fields'), 'fields')))
+        categories = parse_list(data.get('category'), 'category') or None
+        job_types = parse_list(data.get('job_type'), 'job_type') or None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    print(f"Requested batch of {len(areas)} areas: {areas}")
+    
+    try:
+        batch = runtime.run(job_aggregator.search_areas(areas, categories=categories, job_types=job_types))
         
-        # Post-process to filter out blacklisted companies and apply distance filter
-        filtered_jobs = []
-        for job in all_jobs:
-            # Skip if company is in blacklist
-            company_name = job.get('company', {}).get('display_name', '')
-            if company_name in COMPANY_BLACKLIST:
-                print(f"Company {company_name} is blacklisted, skipping")
-                continue
-            
-            # Handle jobs without location data or distance calculation
-            job_lat = job.get('latitude')
-            job_lng = job.get('longitude')
-            
-            # If no coordinates or distance, add it with distance 0
-            if not job_lat or not job_lng or 'distance' not in job:
-                job_lat = lat
-                job_lng = lng
-                job['distance'] = 0
-                job['latitude'] = job_lat
-                job['longitude'] = job_lng
-            
-            # Override distance calculation if needed (some APIs provide this)
-            if 'distance' not in job:
-                distance = calculate_distance(lat, lng, job_lat, job_lng)
-                job['distance'] = distance
-            
-            # Skip if outside radius
-            if job['distance'] > radius:
-                continue
-                
-            # Get additional metadata from Google Maps if needed
-            if (not job.get('company_metadata') or 
-                all(value == 'N/A' for value in job.get('company_metadata', {}).values())):
-                try:
-                    if company_name:
-                        print(f"Getting additional metadata for company: {company_name}")
-                        # Add location context to improve search accuracy
-                        search_query = f"{company_name} {formatted_address}"
-                        places_url = f"https://maps.googleapis.com/maps/api/place/findplacefromtext/json?input={search_query}&inputtype=textquery&fields=formatted_address,name,rating,opening_hours,geometry,place_id&key={GOOGLE_MAPS_API_KEY}"
-                        places_response = requests.get(places_url)
-                        places_data = places_response.json()
-                        
-                        if places_data['status'] == 'OK' and places_data.get('candidates'):
-                            place_id = places_data['candidates'][0]['place_id']
-                            
-                            # Get place details
-                            details_url = f"https://maps.googleapis.com/maps/api/place/details/json?place_id={place_id}&fields=name,formatted_address,formatted_phone_number,website,url&key={GOOGLE_MAPS_API_KEY}"
-                            details_response = requests.get(details_url)
-                            details_data = details_response.json()
-                            
-                            if details_data['status'] == 'OK':
-                                details = details_data['result']
-                                
-                                # Initialize metadata if not present
-                                if 'company_metadata' not in job:
-                                    job['company_metadata'] = {
-                                        'address': 'N/A',
-                                        'phone': 'N/A',
-                                        'website': 'N/A',
-                                        'maps_url': 'N/A'
-                                    }
-                                
-                                # Update metadata with Google data (only if present)
-                                if details.get('formatted_address'):
-                                    job['company_metadata']['address'] = details.get('formatted_address')
-                                
-                                if details.get('formatted_phone_number'):
-                                    job['company_metadata']['phone'] = details.get('formatted_phone_number')
-                                
-                                if details.get('website'):
-                                    job['company_metadata']['website'] = details.get('website')
-                                
-                                if details.get('url'):
-                                    job['company_metadata']['maps_url'] = details.get('url')
-                except Exception as e:
-                    print(f"Error getting company metadata: {str(e)}")
-            
-            # Add coordinates in the format expected by the frontend
-            job['coordinates'] = {
-                'latitude': job_lat,
-                'longitude': job_lng
-            }
-            
-            # Add to filtered jobs
-            filtered_jobs.append(job)
+        # Every job already has coordinates and a distance from its nearest area
+        jobs = filter_jobs(batch['results'], None, None, float('inf'))
         
-        print(f"Total filtered jobs: {len(filtered_jobs)}")
+        # Enrich per area, so company lookups use that area's locality, all
+        # areas within one time budget
+        if wants_company_metadata(fields):
+            addresses = {area['location']: area['formatted_address'] for area in batch['areas'] if 'formatted_address' in area}
+            by_address = {}
+            for job in jobs:
+                by_address.setdefault(addresses[job['search_location']], []).append(job)
+            runtime.run(company_enricher.enrich_areas(by_address))
         
         return jsonify({
-            'total': len(filtered_jobs),
-            'results': filtered_jobs,
+            'total': len(jobs),
+            'results': [job.to_dict(fields + ['search_location', 'distance'] if fields else None) for job in jobs],
+            'areas': batch['areas'],
+            'queries': batch['queries']
+        })
+    except Exception as e:
+        print(f"Error processing batch request: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<path:job_id>', methods=['GET'])
+def get_job(job_id):
+    """Full record of one job from a stored search
+    
+    Pass the list response's ``result_set`` to look in that search only.
+    """
+    job, result = job_aggregator.result_sets.find_job(job_id, request.args.get('result_set'))
+    if job is None:
+        return jsonify({'error': 'Job not found, the search may have expired'}), 404
+    
+    try:
+        origin = result['origin']
+        job = filter_jobs([job.copy()], origin['latitude'], origin['longitude'], float('inf'))[0]
+        runtime.run(company_enricher.enrich([job], origin['formatted_address']))
+        return jsonify(job.to_dict())
+    except Exception as e:
+        print(f"Error loading job {job_id}: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/stream', methods=['GET'])
+def stream_jobs():
+    """Stream jobs as NDJSON, one event per line, as each API responds
+    
+    Events: ``origin`` first, then ``jobs`` per connector (upsert by id),
+    ``dedup`` listing earlier jobs a later duplicate was merged into,
+    ``metadata`` with company details from Google Places, and a final
+    ``summary``.
+    
+    Streamed searches aren't stored for /api/jobs/<id>, so jobs are sent as
+    full records unless ``fields`` asks for a projection.
+    """
+    location = request.args.get('location', '')
+    args = MultiDict(request.args)
+    args.setdefault('fields', 'all')
+    try:
+        view = parse_view(args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    radius = view['radius'] or 10  # default 10km
+    categories = view['categories']
+    job_types = view['job_types']
+    fields = view['fields']
+    
+    if not location:
+        return jsonify({'error': 'Location is required'}), 400
+    
+    geocoded = runtime.run(geocoder.geocode_async(location))
+    if geocoded is None:
+        return jsonify({'error': 'Could not geocode location'}), 400
+    
+    lat = geocoded['latitude']
+    lng = geocoded['longitude']
+    formatted_address = geocoded['formatted_address']
+    
+    def generate():
+        yield app.json.dumps({
+            'event': 'origin',
+            'formatted_address': formatted_address,
             'coordinates': {
                 'latitude': lat,
                 'longitude': lng
             }
-        })
+        }) + '\n'
         
-    except Exception as e:
-        print(f"Error processing request: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        streamed_jobs = {}
+        try:
+            events = runtime.iterate(job_aggregator.stream_jobs(
+                location=formatted_address,
+                radius=radius,
+                categories=categories if categories else None,
+                job_types=job_types if job_types else None,
+                origin=geocoded
+            ))
+            for event in events:
+                if event['event'] == 'jobs':
+                    event['results'] = filter_jobs(event['results'], lat, lng, radius)
+                    for job in event['results']:
+                        streamed_jobs[job['id']] = job
+                elif event['event'] == 'summary' and wants_company_metadata(fields):
+                    # Enrich once every connector is in, then send only what changed
+                    jobs = list(streamed_jobs.values())
+                    before = [job.get('company_metadata') for job in jobs]
+                    runtime.run(company_enricher.enrich(jobs, formatted_address))
+                    updates = {
+                        job['id']: job['company_metadata']
+                        for job, metadata in zip(jobs, before)
+                        if job.get('company_metadata') is not metadata
+                    }
+                    if updates:
+                        yield app.json.dumps({'event': 'metadata', 'company_metadata': updates}) + '\n'
+                
+                if event['event'] == 'summary':
+                    event['total'] = len(streamed_jobs)
+                elif event['event'] == 'jobs':
+                    # Jobs stay compact records until they reach the wire
+                    event = dict(event, results=[job.to_dict(fields) for job in event['results']])
+                yield app.json.dumps(event) + '\n'
+        except Exception as e:
+            print(f"Error streaming jobs: {str(e)}")
+            yield app.json.dumps({'event': 'error', 'error': str(e)}) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
 
 @app.route('/api/save', methods=['POST'])
 def save_company():
@@ -275,4 +587,4 @@ def save_company():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(debug=True, threaded=True)
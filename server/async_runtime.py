@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+
+class AsyncRuntime:
+    """Runs one long-lived asyncio event loop on a background thread.
+
+    Flask request threads submit coroutines with ``run`` and wait for the
+    result, so every request shares the same loop and the same long-lived
+    HTTP sessions instead of building a fresh loop per request.
+    """
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown_hooks: List[Callable[[], Awaitable[Any]]] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the event loop thread if it isn't running yet."""
+        with self._lock:
+            if self.loop is not None:
+                return
+
+            ready = threading.Event()
+
+            def run_loop():
+                self.loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self.loop)
+                ready.set()
+                self.loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name='async-runtime', daemon=True)
+            self._thread.start()
+            ready.wait()
+            print("[AsyncRuntime] Event loop started")
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the shared loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to schedule
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The coroutine's result; its exceptions are re-raised here
+        """
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def iterate(self, agen: AsyncIterator[Any]) -> Iterator[Any]:
+        """Consume an async generator on the shared loop as a plain generator.
+
+        Used for streaming responses; closing the returned generator (e.g.
+        when the client disconnects) closes the async generator too.
+        """
+        async def next_item():
+            return await agen.__anext__()
+
+        try:
+            while True:
+                try:
+                    item = self.run(next_item())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            self.run(agen.aclose())
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[Any]]):
+        """Register an async callable (e.g. a session close) to run on stop."""
+        self._shutdown_hooks.append(hook)
+
+    def stop(self):
+        """Run shutdown hooks, then stop and close the loop."""
+        with self._lock:
+            if self.loop is None:
+                return
+
+            for hook in self._shutdown_hooks:
+                try:
+                    asyncio.run_coroutine_threadsafe(hook(), self.loop).result(5)
+                except Exception as e:
+                    print(f"[AsyncRuntime] Error in shutdown hook: {str(e)}")
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.loop = None
+            print("[AsyncRuntime] Event loop stopped")
@@ -0,0 +1,104 @@
+import gzip
+import hashlib
+import os
+
+from flask import jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+# Optional fast paths: orjson for serialization, Brotli for compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'text/html', 'text/plain'}
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson when it is installed.
+
+    Falls back to the stdlib ``json`` module (Flask's default provider)
+    otherwise, or when a caller passes stdlib-specific options. Keys are
+    not sorted, which the API doesn't rely on and saves a pass per object.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        # Build the body as bytes directly, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def choose_encoding(response):
+    """
+    Content encoding to compress a response with, negotiated from the
+    request's Accept-Encoding header.
+
+    Returns:
+        str: ``br``, ``gzip`` or None to send the response as-is
+    """
+    # Read per call: the app loads .env after importing this module
+    min_size = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or response.content_length is None or response.content_length < min_size):
+        return None
+
+    accepted = request.accept_encodings
+    gzip_quality = accepted['gzip']
+    if brotli is not None and accepted['br'] and accepted['br'] >= gzip_quality:
+        return 'br'
+    if gzip_quality:
+        return 'gzip'
+    return None
+
+
+def compress_response(response):
+    """after_request hook compressing JSON and text bodies (gzip, or Brotli if installed)."""
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(response)
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=int(os.getenv('BROTLI_QUALITY', 5))))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=int(os.getenv('GZIP_LEVEL', 6)), mtime=0))
+    response.headers['Content-Encoding'] = encoding
+
+    # A strong ETag identifies one exact representation, so tag each encoding separately
+    etag, weak = response.get_etag()
+    if etag and not weak and not etag.endswith(f'-{encoding}'):
+        response.set_etag(f'{etag}-{encoding}')
+    return response
+
+
+def etag_json(payload):
+    """
+    JSON response with a strong ETag, answered with 304 Not Modified when
+    the client's If-None-Match already has this representation.
+    """
+    response = jsonify(payload)
+    etag = hashlib.sha256(response.get_data()).hexdigest()[:32]
+
+    # Tag the representation compress_response is about to produce
+    encoding = choose_encoding(response)
+    response.set_etag(f'{etag}-{encoding}' if encoding else etag)
+    return response.make_conditional(request)
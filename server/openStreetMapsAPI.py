@@ -15,11 +15,14 @@ HEADERS = {
 }
 
 def process_areas(area_list):
-    all_offices = []
+    # Overlapping areas return the same offices, so keep one per OSM element
+    # (ids are only unique within an element type: node, way or relation)
+    all_offices = {}
     for postcode, radius in area_list:
         offices = process_area(postcode, radius)
-        all_offices.extend(offices)
-    return all_offices
+        for office in offices:
+            all_offices[(office["osm_type"], office["id"])] = office
+    return list(all_offices.values())
 
 def process_area(postcode, radius):
     lat, lon = get_coordinates_from_postcode(postcode)
@@ -64,6 +67,7 @@ def get_offices(lat, lon, radius):
         for e in elements:
             office = {
                 "id": e["id"],
+                "osm_type": e["type"],
                 "name": e.get("tags", {}).get("name", "N/A"),
                 "type": e.get("tags", {}).get("office", "N/A"),
                 "lat": e.get("lat", e.get("center", {}).get("lat", 0)),
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Tests run from server/ (see CONTRIBUTING.md); make the app's packages importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,189 @@
+import asyncio
+import types
+
+from api_connectors import result_cache
+from api_connectors import AdzunaConnector, Geocoder, IndeedConnector, Job, JobAggregator, ReedConnector
+from api_connectors.result_cache import SearchResultCache
+
+ORIGIN = {'latitude': 51.5074, 'longitude': -0.1278, 'formatted_address': 'London, UK', 'bounds': None}
+
+
+def make_aggregator(*connectors):
+    aggregator = JobAggregator(geocoder=Geocoder('test-key', cache_path=':memory:'))
+    for connector in connectors:
+        aggregator.add_connector(connector)
+    return aggregator
+
+
+def test_provider_failures_are_reported_and_not_cached():
+    reed = ReedConnector('test-key')
+    adzuna = AdzunaConnector('test-id', 'test-key')
+
+    async def service_unavailable(url, params=None, headers=None):
+        return 503, None
+
+    async def connection_refused(url, params=None, headers=None):
+        raise ConnectionError('Connection refused')
+
+    reed._get_json = service_unavailable
+    adzuna._get_json = connection_refused
+    aggregator = make_aggregator(reed, adzuna)
+
+    async def search_twice():
+        first = await aggregator.search_jobs('London', 10, origin=ORIGIN)
+        second = await aggregator.search_jobs('London', 10, origin=ORIGIN)
+        return first, second
+
+    first, second = asyncio.run(search_twice())
+
+    assert first['sources'][reed.name]['status'] == 'error'
+    assert '503' in first['sources'][reed.name]['error']
+    assert first['sources'][adzuna.name]['status'] == 'error'
+    assert second['cache'] == SearchResultCache.MISS
+
+
+class StaticConnector:
+    """Connector returning a fixed list of jobs"""
+
+    name = 'Static'
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        return [Job.from_dict(job) for job in self.jobs]
+
+
+def static_jobs(count):
+    """Jobs spread north of the test origin, 0.5km apart"""
+    return [
+        {'id': f'job-{i}', 'title': f'Job {i}', 'company': {'display_name': f'Company {i}'},
+         'latitude': ORIGIN['latitude'] + i * 0.0045, 'longitude': ORIGIN['longitude'],
+         'salary_max': 30000 + (i * 7919) % 50000, 'created': f'2026-10-{1 + i % 28:02d}T09:00:00'}
+        for i in range(count)
+    ]
+
+
+def test_refiltering_a_page_copy_keeps_the_stored_result_set():
+    aggregator = make_aggregator(StaticConnector(static_jobs(20)))
+
+    page = asyncio.run(aggregator.search_jobs('London', 10, origin=ORIGIN, limit=0))
+    bounds = {'south': 51.5, 'west': -0.2, 'north': 51.53, 'east': 0.0}
+    narrowed = aggregator.refilter(page, bounds=bounds, limit=5)
+
+    assert narrowed['result_set'] == page['result_set']
+    stored = aggregator.result_sets.get(page['result_set'])
+    assert len(stored['results']) == 20
+    job, _ = aggregator.result_sets.find_job(narrowed['results'][0]['id'])
+    assert job is not None
+
+
+def test_indeed_dates_are_converted_to_iso():
+    connector = IndeedConnector()
+
+    job = connector.standardize_job({'jobkey': 'k1', 'jobtitle': 'Developer', 'company': 'Acme',
+                                     'date': 'Mon, 02 Oct 2017 14:30:00 GMT'})
+    undated = connector.standardize_job({'jobkey': 'k2', 'jobtitle': 'Developer', 'date': 'yesterday'})
+
+    assert job['created'] == '2017-10-02T14:30:00+00:00'
+    assert undated['created'] is None
+
+
+def test_searches_cut_short_by_a_half_open_circuit_are_skipped_and_not_cached():
+    reed = ReedConnector('test-key')
+    for _ in range(reed.governor.failure_threshold):
+        reed.governor.record_failure()
+    # Recovery time is up, so the next call is the half-open trial
+    reed.governor._opened_at -= reed.governor.recovery_time
+
+    async def trial_call(url, params=None, headers=None):
+        # Only the first sub-query gets the trial call; the other is refused
+        await reed.governor.acquire()
+        await asyncio.sleep(0.01)
+        await reed.governor.release(200)
+        return 200, {'results': [], 'totalResults': 0}
+
+    reed._get_json = trial_call
+    aggregator = make_aggregator(reed)
+
+    async def search_twice():
+        first = await aggregator.search_jobs('London', 10, job_types=['permanent', 'contract'], origin=ORIGIN)
+        second = await aggregator.search_jobs('London', 10, job_types=['permanent', 'contract'], origin=ORIGIN)
+        return first, second
+
+    first, second = asyncio.run(search_twice())
+
+    assert first['sources'][reed.name]['status'] == 'skipped'
+    assert second['cache'] == SearchResultCache.MISS
+
+
+def test_narrow_search_answered_from_a_wider_one_pages_only_its_radius():
+    aggregator = make_aggregator(StaticConnector(static_jobs(40)))
+
+    async def search_wide_then_narrow():
+        await aggregator.search_jobs('London', 20, origin=ORIGIN)
+        return await aggregator.search_jobs('London', 5, origin=ORIGIN, limit=5)
+
+    narrow = asyncio.run(search_wide_then_narrow())
+    stored = aggregator.result_sets.get(narrow['result_set'])
+    next_page = aggregator.refilter(stored, offset=5, limit=5)
+    bounds = {'south': 51.0, 'west': -1.0, 'north': 52.0, 'east': 1.0}
+    in_view = aggregator.refilter(narrow, bounds=bounds, limit=5)
+
+    assert narrow['cache'] == SearchResultCache.HIT
+    assert narrow['total'] == 10
+    assert stored['radius'] == 5
+    assert next_page['total'] == 10
+    assert [job['id'] for job in next_page['results']] == [f'job-{i}' for i in range(5, 10)]
+    assert in_view['total'] == 10
+
+
+class SwitchableConnector(StaticConnector):
+    """Static connector whose jobs can be changed, or made to fail"""
+
+    failing = False
+
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        if self.failing:
+            raise ConnectionError('Connection refused')
+        return await super().search_jobs(location, radius, categories, job_types, origin)
+
+
+def stale_search(monkeypatch, fail_refresh):
+    """Search, let the result go stale, search again and let the background refresh finish"""
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(result_cache, 'time', types.SimpleNamespace(monotonic=lambda: clock.now))
+    connector = SwitchableConnector(static_jobs(3))
+    aggregator = make_aggregator(connector)
+    aggregator.result_cache = SearchResultCache(ttl=300, stale_ttl=1800)
+
+    async def search():
+        first = await aggregator.search_jobs('London', 10, origin=ORIGIN)
+        clock.now += 301
+        connector.jobs = static_jobs(5)
+        connector.failing = fail_refresh
+        stale = await aggregator.search_jobs('London', 10, origin=ORIGIN)
+        await asyncio.sleep(0.05)
+        after_refresh = await aggregator.search_jobs('London', 10, origin=ORIGIN)
+        return first, stale, after_refresh
+
+    return asyncio.run(search())
+
+
+def test_stale_results_are_served_and_replaced_by_the_background_refresh(monkeypatch):
+    first, stale, refreshed = stale_search(monkeypatch, fail_refresh=False)
+
+    assert first['cache'] == SearchResultCache.MISS
+    assert stale['cache'] == SearchResultCache.STALE
+    assert stale['total'] == 3
+    assert refreshed['cache'] == SearchResultCache.HIT
+    assert refreshed['total'] == 5
+
+
+def test_a_failed_refresh_keeps_the_stale_results(monkeypatch):
+    _, stale, after_refresh = stale_search(monkeypatch, fail_refresh=True)
+
+    assert stale['cache'] == SearchResultCache.STALE
+    assert after_refresh['cache'] == SearchResultCache.STALE
+    assert after_refresh['total'] == 3
+    assert after_refresh['sources']['Static']['status'] == 'ok'
@@ -0,0 +1,75 @@
+import pytest
+
+from api_connectors.result_sets import encode_cursor
+from app import app, filter_jobs, parse_areas, parse_cursor, parse_list
+
+
+def test_filter_jobs_keeps_the_page_order():
+    # Sorted by salary, not distance; the last job is outside the radius
+    jobs = [
+        {'id': 'far', 'latitude': 51.60, 'longitude': -0.1278, 'salary_max': 90000},
+        {'id': 'near', 'latitude': 51.51, 'longitude': -0.1278, 'salary_max': 60000},
+        {'id': 'origin', 'salary_max': 40000},
+        {'id': 'outside', 'latitude': 52.50, 'longitude': -0.1278, 'salary_max': 30000},
+    ]
+
+    filtered = filter_jobs(jobs, 51.5074, -0.1278, 20)
+
+    assert [job['id'] for job in filtered] == ['far', 'near', 'origin']
+    assert filtered[2]['coordinates'] == {'latitude': 51.5074, 'longitude': -0.1278}
+
+
+def test_cursor_views_round_trip():
+    view = {'result_set': 'abc', 'radius': 5.0, 'categories': ['IT Jobs'], 'job_types': [],
+            'bounds': {'south': 51.5, 'west': -0.2, 'north': 51.6, 'east': 0.0},
+            'sort': 'salary', 'offset': 20, 'limit': 20, 'fields': ['id', 'title']}
+
+    assert parse_cursor(encode_cursor(view)) == view
+
+
+@pytest.mark.parametrize('view', [
+    {'result_set': 'abc', 'radius': None},
+    {'result_set': 'abc', 'radius': None, 'sort': 'distance', 'offset': -20},
+    {'result_set': 'abc', 'radius': None, 'sort': 'nearest', 'offset': 0},
+    {'result_set': 'abc', 'radius': None, 'sort': 'distance', 'offset': 0, 'bounds': [1, 2, 3, 4]},
+    {'result_set': None, 'radius': None, 'sort': 'distance', 'offset': 0},
+])
+def test_invalid_cursor_views_are_rejected(view):
+    with pytest.raises(ValueError):
+        parse_cursor(encode_cursor(view))
+
+
+@pytest.mark.parametrize('radius', ['inf', 'nan', -5, None, 'ten'])
+def test_batch_areas_need_a_finite_non_negative_radius(radius):
+    with pytest.raises(ValueError):
+        parse_areas([['Leeds', radius]])
+
+
+def test_batch_filters_are_lists_of_strings():
+    assert parse_list('IT Jobs', 'category') == ['IT Jobs']
+    assert parse_list(['IT Jobs', 'Sales Jobs'], 'category') == ['IT Jobs', 'Sales Jobs']
+    assert parse_list(None, 'category') == []
+    with pytest.raises(ValueError):
+        parse_list({'IT Jobs': True}, 'category')
+
+
+@pytest.mark.parametrize('body', [
+    {'areas': [['Leeds', 10]], 'category': 5},
+    {'areas': [['Leeds', 10]], 'job_type': ['permanent', 3]},
+    {'areas': [['Leeds', 10]], 'fields': {'id': True}},
+    {'areas': [['Leeds', -10]]},
+])
+def test_invalid_batch_requests_are_rejected(body):
+    response = app.test_client().post('/api/jobs/batch', json=body)
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('endpoint', ['/api/jobs', '/api/jobs/stream'])
+@pytest.mark.parametrize('radius', ['abc', '-5', 'inf'])
+def test_invalid_radius_is_a_json_400(endpoint, radius):
+    response = app.test_client().get(endpoint, query_string={'location': 'Leeds', 'radius': radius})
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'radius must be a non-negative number'}
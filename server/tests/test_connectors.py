@@ -0,0 +1,151 @@
+import asyncio
+
+from api_connectors import AdzunaConnector, ReedConnector
+from api_connectors.fallback_policy import FallbackPolicy
+
+ORIGIN = {'latitude': 51.5074, 'longitude': -0.1278, 'formatted_address': 'London, UK', 'bounds': None}
+
+
+def adzuna_page(page, kilometres):
+    """One page of raw Adzuna jobs due north of the origin at the given distances"""
+    return [
+        {'id': f'{page}-{i}', 'title': 'Developer', 'company': {'display_name': 'Acme'},
+         'latitude': ORIGIN['latitude'] + km / 111.2, 'longitude': ORIGIN['longitude']}
+        for i, km in enumerate(kilometres)
+    ]
+
+
+def paged_adzuna(pages):
+    """Adzuna connector answering from canned pages, one page fetched at a time"""
+    adzuna = AdzunaConnector('test-id', 'test-key')
+    adzuna.max_results = 100 * len(pages)
+    adzuna.page_concurrency = 1
+    fetched = []
+
+    async def get_json(url, params=None, headers=None):
+        page = int(url.rsplit('/', 1)[1])
+        fetched.append(page)
+        return 200, {'count': 100 * len(pages), 'results': pages[page - 1]}
+
+    adzuna._get_json = get_json
+    return adzuna, fetched
+
+
+def test_adzuna_keeps_paging_past_an_unordered_page_outside_the_radius():
+    adzuna, fetched = paged_adzuna([
+        adzuna_page(1, [1 + i % 5 for i in range(100)]),
+        adzuna_page(2, [30 - i % 5 for i in range(100)]),
+        adzuna_page(3, [2 + i % 5 for i in range(100)]),
+    ])
+
+    jobs = asyncio.run(adzuna.search_jobs('London', 10, origin=ORIGIN))
+
+    assert fetched == [1, 2, 3]
+    assert len(jobs) == 300
+
+
+def test_adzuna_stops_paging_at_a_nearest_first_page_outside_the_radius():
+    adzuna, fetched = paged_adzuna([
+        adzuna_page(1, [1 + i / 20 for i in range(100)]),
+        adzuna_page(2, [20 + i / 20 for i in range(100)]),
+        adzuna_page(3, [30 + i / 20 for i in range(100)]),
+    ])
+
+    jobs = asyncio.run(adzuna.search_jobs('London', 10, origin=ORIGIN))
+
+    assert fetched == [1, 2]
+    assert len(jobs) == 200
+
+
+def test_reed_jobs_keep_reeds_job_id():
+    reed = ReedConnector('test-key')
+
+    job = reed.standardize_job({'jobId': 51234567, 'jobTitle': 'Store Manager', 'employerName': 'Acme'})
+
+    assert job['id'] == 'reed-51234567'
+    assert reed.standardize_job({'jobId': 51234567, 'jobTitle': 'Store Manager'})['id'] == job['id']
+
+
+def fallback_adzuna(mode, area_results):
+    """Adzuna connector whose area search finds ``area_results``; the generic search is slower"""
+    adzuna = AdzunaConnector('test-id', 'test-key')
+    adzuna.fallback = FallbackPolicy(mode)
+    calls = []
+
+    async def get_json(url, params=None, headers=None):
+        if 'where' in params:
+            await asyncio.sleep(0.01)
+            calls.append('area')
+            return 200, {'count': len(area_results), 'results': area_results}
+        calls.append('generic')
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            calls.append('generic cancelled')
+            raise
+        return 200, {'count': 1, 'results': adzuna_page('generic', [300])}
+
+    adzuna._get_json = get_json
+    return adzuna, calls
+
+
+def search(adzuna, location='Leeds'):
+    async def search_and_settle():
+        jobs = await adzuna.search_jobs(location, 10)
+        # Let a cancelled speculative search finish unwinding
+        await asyncio.sleep(0.01)
+        return jobs
+    return asyncio.run(search_and_settle())
+
+
+def test_sequential_fallback_only_runs_after_an_empty_search():
+    adzuna, calls = fallback_adzuna(FallbackPolicy.SEQUENTIAL, [])
+
+    jobs = search(adzuna)
+
+    assert calls == ['area', 'generic']
+    assert [job['id'] for job in jobs] == ['generic-0']
+
+
+def test_sequential_fallback_is_not_run_when_the_search_finds_jobs():
+    adzuna, calls = fallback_adzuna(FallbackPolicy.SEQUENTIAL, adzuna_page(1, [2]))
+
+    jobs = search(adzuna)
+
+    assert calls == ['area']
+    assert [job['id'] for job in jobs] == ['1-0']
+
+
+def test_speculative_fallback_is_cancelled_when_the_search_finds_jobs():
+    adzuna, calls = fallback_adzuna(FallbackPolicy.SPECULATIVE, adzuna_page(1, [2]))
+
+    jobs = search(adzuna)
+
+    assert calls == ['generic', 'area', 'generic cancelled']
+    assert [job['id'] for job in jobs] == ['1-0']
+
+
+def test_speculative_fallback_answers_an_empty_search_without_a_second_call():
+    adzuna, calls = fallback_adzuna(FallbackPolicy.SPECULATIVE, [])
+
+    jobs = search(adzuna)
+
+    assert calls == ['generic', 'area']
+    assert [job['id'] for job in jobs] == ['generic-0']
+
+
+def test_adaptive_fallback_speculates_where_searches_came_back_empty():
+    adzuna, calls = fallback_adzuna(FallbackPolicy.ADAPTIVE, [])
+
+    search(adzuna)
+    first = list(calls)
+    calls.clear()
+    search(adzuna)
+    second = list(calls)
+    calls.clear()
+    search(adzuna, 'York')
+
+    assert first == ['area', 'generic']
+    assert second == ['generic', 'area']
+    # York is unseen and the overall empty rate is still low
+    assert calls == ['area', 'generic']
@@ -0,0 +1,80 @@
+import pytest
+
+from api_connectors import Job
+from api_connectors.dedup import DedupEngine, company_key, merge_jobs, title_tokens
+
+
+def job(id, title, company, **fields):
+    return Job.from_dict(dict(fields, id=id, title=title, company={'display_name': company}))
+
+
+@pytest.mark.parametrize('name', ['Acme Ltd', 'ACME Limited', 'The Acme Group plc', 'Acme'])
+def test_company_keys_ignore_legal_forms(name):
+    assert company_key(name) == 'acme'
+
+
+def test_company_keys_drop_a_dangling_and():
+    assert company_key('Smith & Co') == company_key('Smith and Company Ltd') == 'smith'
+
+
+def test_title_tokens_expand_abbreviations_and_drop_gender_markers():
+    assert title_tokens('Sr Dev (m/f/d)') == title_tokens('Senior Developer') == {'senior', 'developer'}
+
+
+def test_ltd_and_senior_variants_merge():
+    engine = DedupEngine()
+
+    first, _ = engine.add(job('adzuna-1', 'Senior Developer', 'Acme Ltd'))
+    record, existing = engine.add(job('reed-1', 'Sr Developer', 'ACME Limited'))
+
+    assert existing is first
+    assert record['id'] == 'adzuna-1'
+    assert len(engine) == 1
+
+
+@pytest.mark.parametrize('title, company', [
+    ('Senior Developer Team Lead', 'Acme Ltd'),  # Similar title, below the threshold
+    ('Junior Developer', 'Acme Ltd'),
+    ('Senior Developer', 'Acme Logistics Ltd'),  # Same title, another employer
+])
+def test_near_misses_stay_separate(title, company):
+    engine = DedupEngine()
+    engine.add(job('adzuna-1', 'Senior Developer', 'Acme Ltd'))
+
+    record, existing = engine.add(job('reed-1', title, company))
+
+    assert existing is None
+    assert record['id'] == 'reed-1'
+    assert len(engine) == 2
+
+
+def test_merge_fills_placeholders_and_keeps_the_primarys_values():
+    primary = job('adzuna-1', 'Senior Developer', 'Acme Ltd', salary_max=None, description='Build things',
+                  contract_type='Unknown', company_metadata={'address': 'N/A', 'phone': '0113 000 0000'})
+    secondary = job('reed-1', 'Sr Developer', 'ACME Limited', salary_max=60000, description='Other text',
+                    contract_type='permanent', latitude=53.8,
+                    company_metadata={'address': '1 High Street, Leeds', 'phone': '0113 999 9999'})
+
+    merged = merge_jobs(primary, secondary)
+
+    assert merged['id'] == 'adzuna-1'
+    assert merged['description'] == 'Build things'
+    assert merged['salary_max'] == 60000
+    assert merged['contract_type'] == 'permanent'
+    assert merged['latitude'] == 53.8
+    assert merged['company_metadata'] == {'address': '1 High Street, Leeds', 'phone': '0113 000 0000'}
+    # Neither input is modified
+    assert primary['salary_max'] is None
+    assert primary['company_metadata']['address'] == 'N/A'
+
+
+def test_richer_duplicate_becomes_the_primary_but_keeps_the_existing_id():
+    engine = DedupEngine(has_more_data=lambda new, existing: new.richness > existing.richness)
+    engine.add(job('adzuna-1', 'Senior Developer', 'Acme Ltd', description='Short'))
+
+    record, _ = engine.add(job('reed-1', 'Senior Developer', 'Acme Ltd', description='Full advert',
+                               salary_max=60000, latitude=53.8, longitude=-1.5))
+
+    assert record['id'] == 'adzuna-1'
+    assert record['description'] == 'Full advert'
+    assert engine.records() == [record]
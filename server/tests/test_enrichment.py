@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from api_connectors import CompanyEnricher
+from api_connectors.company_store import CompanyMetadataStore
+
+
+def test_batch_areas_share_one_time_budget():
+    enricher = CompanyEnricher('test-key', time_budget=0.2, store=CompanyMetadataStore(path=':memory:'))
+
+    async def slow_lookup(session, semaphore, company_name, formatted_address):
+        await asyncio.sleep(5)
+        return True, None
+
+    enricher._lookup = slow_lookup
+    jobs_by_address = {f'Area {i}, UK': [{'company': {'display_name': f'Company {i}'}}] for i in range(4)}
+
+    async def enrich():
+        try:
+            await enricher.enrich_areas(jobs_by_address)
+        finally:
+            await enricher.close()
+
+    started = time.monotonic()
+    asyncio.run(enrich())
+
+    assert time.monotonic() - started < 0.6
+
+
+def test_lookups_past_the_time_budget_are_stored_for_the_next_search():
+    store = CompanyMetadataStore(path=':memory:')
+    enricher = CompanyEnricher('test-key', time_budget=0.1, store=store)
+    lookups = []
+
+    async def slow_lookup(session, semaphore, company_name, formatted_address):
+        lookups.append(company_name)
+        await asyncio.sleep(0.3)
+        return True, {'formatted_address': '1 High Street, Leeds', 'website': 'https://acme.example'}
+
+    enricher._lookup = slow_lookup
+
+    async def search_twice():
+        try:
+            first = await enricher.enrich([{'company': {'display_name': 'Acme Ltd'}}], 'Leeds, UK')
+            await asyncio.sleep(0.4)
+            second = await enricher.enrich([{'company': {'display_name': 'Acme Ltd'}}], 'Leeds, UK')
+            return first, second
+        finally:
+            await enricher.close()
+
+    first, second = asyncio.run(search_twice())
+
+    assert 'company_metadata' not in first[0]
+    assert second[0]['company_metadata']['website'] == 'https://acme.example'
+    assert lookups == ['Acme Ltd']
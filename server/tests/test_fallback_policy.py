@@ -0,0 +1,57 @@
+import pytest
+
+from api_connectors.fallback_policy import FallbackPolicy
+
+
+def test_area_keys_are_cells_around_the_origin_or_the_location_text():
+    leeds = {'latitude': 53.7997, 'longitude': -1.5492}
+    nearby = {'latitude': 53.8102, 'longitude': -1.5391}
+
+    assert FallbackPolicy.area_key('Leeds', leeds) == FallbackPolicy.area_key('Headingley', nearby) == (53.8, -1.5)
+    assert FallbackPolicy.area_key('  Leeds ') == FallbackPolicy.area_key('leeds') == 'leeds'
+
+
+def test_first_outcome_is_taken_as_is_then_moves_gradually():
+    policy = FallbackPolicy()
+
+    policy.record('leeds', empty=True)
+    assert policy.empty_rate('leeds') == 1.0
+    assert policy.should_speculate('leeds')
+
+    policy.record('leeds', empty=False)
+    assert policy.empty_rate('leeds') == pytest.approx(0.7)
+    policy.record('leeds', empty=False)
+    assert policy.empty_rate('leeds') == pytest.approx(0.49)
+    assert not policy.should_speculate('leeds')
+
+
+def test_unseen_areas_use_the_overall_rate():
+    policy = FallbackPolicy(threshold=0.15)
+
+    policy.record('leeds', empty=True)
+    assert policy.empty_rate('york') == pytest.approx(0.1)
+    assert not policy.should_speculate('york')
+
+    policy.record('hull', empty=True)
+    assert policy.empty_rate('york') == pytest.approx(0.19)
+    assert policy.should_speculate('york')
+
+
+def test_least_recently_seen_areas_are_forgotten():
+    policy = FallbackPolicy(max_areas=2)
+    for area in ('leeds', 'york', 'hull'):
+        policy.record(area, empty=True)
+
+    assert policy.empty_rate('leeds') == policy.empty_rate('nowhere')
+    assert policy.empty_rate('hull') == 1.0
+
+
+def test_fixed_modes_ignore_the_rates():
+    sequential = FallbackPolicy(FallbackPolicy.SEQUENTIAL)
+    speculative = FallbackPolicy(FallbackPolicy.SPECULATIVE)
+    sequential.record('leeds', empty=True)
+
+    assert not sequential.should_speculate('leeds')
+    assert speculative.should_speculate('leeds')
+    with pytest.raises(ValueError):
+        FallbackPolicy('eager')
@@ -0,0 +1,23 @@
+import asyncio
+
+import requests
+
+from api_connectors import Geocoder
+from api_connectors import geocoder as geocoder_module
+
+
+def test_a_geocode_timeout_is_a_failed_geocode(monkeypatch):
+    geocoder = Geocoder('test-key', cache_path=':memory:', timeout=0.5)
+    timeouts = []
+
+    def hung_request(url, params=None, timeout=None):
+        timeouts.append(timeout)
+        raise requests.Timeout('Read timed out')
+
+    monkeypatch.setattr(geocoder_module.requests, 'get', hung_request)
+
+    async def geocode_concurrently():
+        return await asyncio.gather(geocoder.geocode_async('Leeds'), geocoder.geocode_async('leeds'))
+
+    assert asyncio.run(geocode_concurrently()) == [None, None]
+    assert timeouts == [0.5]
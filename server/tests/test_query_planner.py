@@ -0,0 +1,92 @@
+from api_connectors import AdzunaConnector, GoogleJobsConnector, IndeedConnector, ReedConnector
+from api_connectors.query_planner import _narrow, plan_search
+
+
+class PlainConnector:
+    """Connector that doesn't declare capabilities"""
+
+    name = 'Plain'
+
+    async def search_jobs(self, location, radius, categories=None, job_types=None, origin=None):
+        return []
+
+
+def connectors():
+    return AdzunaConnector('test-id', 'test-key'), ReedConnector('test-key'), IndeedConnector('test-publisher')
+
+
+def plans_by_connector(plans):
+    return {plan['connector']: plan for plan in plans}
+
+
+def test_narrow_keeps_only_supported_values():
+    assert _narrow(['IT Jobs', 'Banking Jobs'], frozenset(['IT Jobs'])) == ['IT Jobs']
+    assert _narrow(['IT Jobs'], None) == ['IT Jobs']
+    assert _narrow([], frozenset(['IT Jobs'])) is None
+    assert _narrow(None, None) is None
+
+
+def test_a_reed_only_category_skips_adzuna_and_indeed():
+    adzuna, reed, indeed = connectors()
+
+    plans, skipped = plan_search([adzuna, reed, indeed], 10, categories=['Banking Jobs'])
+
+    assert [plan['connector'] for plan in plans] == [reed]
+    assert plans[0]['categories'] == ['Banking Jobs']
+    assert dict(skipped) == {
+        adzuna: 'No requested category is supported',
+        indeed: 'No requested category is supported'
+    }
+
+
+def test_job_types_are_narrowed_per_connector():
+    adzuna, reed, indeed = connectors()
+
+    plans, skipped = plan_search([adzuna, reed, indeed], 10, job_types=['permanent', 'temp', 'remote'])
+    plans = plans_by_connector(plans)
+
+    assert skipped == []
+    assert plans[adzuna]['job_types'] == ['permanent']
+    assert plans[reed]['job_types'] == ['permanent', 'temp']
+    assert plans[indeed]['job_types'] == ['remote']
+
+
+def test_a_connector_supporting_no_requested_job_type_is_skipped():
+    adzuna, reed, indeed = connectors()
+
+    plans, skipped = plan_search([adzuna, reed, indeed], 10, job_types=['remote'])
+
+    assert [plan['connector'] for plan in plans] == [indeed]
+    assert dict(skipped) == {
+        adzuna: 'No requested job type is supported',
+        reed: 'No requested job type is supported'
+    }
+
+
+def test_placeholder_google_jobs_is_skipped():
+    google = GoogleJobsConnector()
+    adzuna = AdzunaConnector('test-id', 'test-key')
+
+    plans, skipped = plan_search([google, adzuna], 10)
+
+    assert [plan['connector'] for plan in plans] == [adzuna]
+    assert skipped == [(google, 'Returns placeholder data only')]
+
+
+def test_connectors_without_capabilities_are_planned_as_is():
+    plain = PlainConnector()
+
+    plans, skipped = plan_search([plain], 25, categories=['Banking Jobs'], job_types=['remote'])
+
+    assert skipped == []
+    assert plans == [{'connector': plain, 'radius': 25, 'categories': ['Banking Jobs'],
+                      'job_types': ['remote'], 'estimated_calls': 1, 'cost': 0.0}]
+
+
+def test_radius_is_capped_at_the_connectors_limit():
+    reed = ReedConnector('test-key')
+    reed.MAX_RADIUS = 50
+
+    plans, _ = plan_search([reed], 80)
+
+    assert plans[0]['radius'] == 50
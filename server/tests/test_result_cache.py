@@ -0,0 +1,64 @@
+import types
+
+import pytest
+
+from api_connectors import result_cache
+from api_connectors.result_cache import SearchResultCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache module"""
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(result_cache, 'time', types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_keys_are_normalized():
+    assert SearchResultCache.make_key(' Leeds ', 10, ['Sales Jobs', 'IT Jobs', 'IT Jobs']) == \
+        SearchResultCache.make_key('leeds', 10.0, ['IT Jobs', 'Sales Jobs'])
+
+
+def test_entries_go_stale_after_the_ttl_then_expire(clock):
+    cache = SearchResultCache(ttl=300, stale_ttl=1800)
+    cache.put('leeds', 'result')
+
+    clock.now += 299
+    assert cache.get('leeds') == ('result', SearchResultCache.HIT)
+    clock.now += 1
+    assert cache.get('leeds') == ('result', SearchResultCache.STALE)
+    clock.now += 1799
+    assert cache.get('leeds') == ('result', SearchResultCache.STALE)
+    clock.now += 1
+    assert cache.get('leeds') == (None, SearchResultCache.MISS)
+    # An expired entry is dropped, not just hidden
+    clock.now -= 2000
+    assert cache.get('leeds') == (None, SearchResultCache.MISS)
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = SearchResultCache(ttl=300, stale_ttl=1800, max_entries=2)
+    cache.put('leeds', 'leeds result')
+    cache.put('york', 'york result')
+
+    cache.get('leeds')
+    cache.put('hull', 'hull result')
+
+    assert cache.get('york') == (None, SearchResultCache.MISS)
+    assert cache.get('leeds') == ('leeds result', SearchResultCache.HIT)
+    assert cache.get('hull') == ('hull result', SearchResultCache.HIT)
+
+
+def test_covering_searches_are_fresh_and_the_narrowest_wider_radius(clock):
+    cache = SearchResultCache(ttl=300, stale_ttl=1800)
+    cache.put(SearchResultCache.make_key('Leeds', 50), 'within 50km')
+    clock.now += 200
+    cache.put(SearchResultCache.make_key('Leeds', 20), 'within 20km')
+    cache.put(SearchResultCache.make_key('Leeds', 20, ['IT Jobs']), 'IT jobs within 20km')
+
+    assert cache.find_covering(SearchResultCache.make_key('Leeds', 5)) == 'within 20km'
+    assert cache.find_covering(SearchResultCache.make_key('Leeds', 30)) == 'within 50km'
+    assert cache.find_covering(SearchResultCache.make_key('York', 5)) is None
+
+    clock.now += 200
+    assert cache.find_covering(SearchResultCache.make_key('Leeds', 30)) is None
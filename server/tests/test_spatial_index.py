@@ -0,0 +1,42 @@
+import math
+import random
+
+from api_connectors.geo import EARTH_RADIUS_KM, haversine_km
+from api_connectors.spatial_index import SpatialIndex
+
+
+def destination(lat, lng, distance_km, bearing):
+    """Point ``distance_km`` from (lat, lng) along ``bearing`` (radians) on the haversine sphere."""
+    angle = distance_km / EARTH_RADIUS_KM
+    lat1, lng1 = math.radians(lat), math.radians(lng)
+    lat2 = math.asin(math.sin(lat1) * math.cos(angle) + math.cos(lat1) * math.sin(angle) * math.cos(bearing))
+    lng2 = lng1 + math.atan2(math.sin(bearing) * math.sin(angle) * math.cos(lat1),
+                             math.cos(angle) - math.sin(lat1) * math.sin(lat2))
+    return math.degrees(lat2), math.degrees(lng2)
+
+
+def test_within_radius_matches_brute_force_near_the_boundary():
+    random.seed(13)
+    for _ in range(200):
+        # Random origins and radii so box edges land anywhere relative to the grid cells
+        lat, lng = random.uniform(-70, 70), random.uniform(-170, 170)
+        radius = random.uniform(1, 50)
+        # Points within 0.1% either side of the radius, in every direction
+        points = [destination(lat, lng, radius * random.uniform(0.999, 1.001), random.uniform(0, 2 * math.pi))
+                  for _ in range(100)]
+        jobs = [{'latitude': p_lat, 'longitude': p_lng} for p_lat, p_lng in points]
+
+        found = {id(job) for job, _ in SpatialIndex(jobs).within_radius(lat, lng, radius)}
+        expected = {id(job) for job in jobs if haversine_km(lat, lng, job['latitude'], job['longitude']) <= radius}
+        assert found == expected
+
+
+def test_nearest_matches_brute_force():
+    random.seed(7)
+    jobs = [{'latitude': 51 + random.random(), 'longitude': -1 + random.random() * 2} for _ in range(2000)]
+    index = SpatialIndex(jobs)
+    for _ in range(20):
+        lat, lng = 51 + random.random(), -1 + random.random() * 2
+        expected = sorted(haversine_km(lat, lng, job['latitude'], job['longitude']) for job in jobs)[:10]
+        found = [distance for _, distance in index.nearest(lat, lng, 10)]
+        assert all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9) for a, b in zip(found, expected))